@@ -9,6 +9,7 @@ from .settings import (
     RetryConfig,
     RouterSettings,
     get_settings,
+    reset_settings_cache,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "RetryConfig",
     "RouterSettings",
     "get_settings",
+    "reset_settings_cache",
 ]
@@ -1,14 +1,20 @@
 """Application settings with modern Pydantic v2 patterns."""
 
-from functools import lru_cache
-
-from pydantic import BaseModel, Field, SecretStr, field_validator
+from pydantic import BaseModel, ConfigDict, Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Names of the provider sub-settings on AppSettings, in routing order
+_PROVIDER_NAMES = ("linkup", "exa", "perplexity", "tavily", "firecrawl")
+
+_VALID_ENVIRONMENTS = frozenset({"development", "staging", "production", "test"})
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
 
 class CacheConfig(BaseModel):
     """Cache configuration settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     redis_url: str = Field(
         default="redis://localhost:6379", description="Redis connection URL"
     )
@@ -32,6 +38,8 @@ class CacheConfig(BaseModel):
 class RetryConfig(BaseModel):
     """Retry configuration settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     max_retries: int = Field(default=3, ge=0, description="Maximum retry attempts")
     base_delay: float = Field(
         default=1.0, gt=0, description="Base delay between retries"
@@ -48,6 +56,8 @@ class RetryConfig(BaseModel):
 class ProviderSettings(BaseModel):
     """Provider configuration settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     api_key: SecretStr = Field(
         default=SecretStr(""), description="API key for the provider"
     )
@@ -59,6 +69,8 @@ class ProviderSettings(BaseModel):
 class RouterSettings(BaseModel):
     """Router configuration settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     max_providers: int = Field(
         default=3, ge=1, description="Maximum providers per query"
     )
@@ -78,6 +90,8 @@ class RouterSettings(BaseModel):
 class MergerSettings(BaseModel):
     """Merger configuration settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     fuzzy_url_threshold: float = Field(
         default=92.0, description="Threshold for fuzzy URL matching"
     )
@@ -107,19 +121,32 @@ class MergerSettings(BaseModel):
 class MiddlewareConfig(BaseModel):
     """Middleware configuration settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     # Auth middleware
     auth_enabled: bool = Field(default=True, description="Enable authentication")
-    auth_api_keys: list[str] = Field(default_factory=list, description="Valid API keys")
-    auth_skip_paths: list[str] = Field(
-        default_factory=lambda: [
-            "/health",
-            "/metrics",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-        ],
+    auth_api_keys: frozenset[str] = Field(
+        default=frozenset(), description="Valid API keys"
+    )
+    auth_skip_paths: frozenset[str] = Field(
+        default=frozenset(
+            {
+                "/health",
+                "/metrics",
+                "/docs",
+                "/redoc",
+                "/openapi.json",
+            }
+        ),
         description="Paths to skip authentication",
     )
+    auth_combine_with_error_handler: bool = Field(
+        default=False,
+        description=(
+            "Run auth and error handling as one outermost middleware; "
+            "rejected requests are then not request-logged"
+        ),
+    )
 
     # Rate limiting
     rate_limit_enabled: bool = Field(default=True, description="Enable rate limiting")
@@ -132,8 +159,8 @@ class MiddlewareConfig(BaseModel):
     rate_limit_global: int = Field(
         default=1000, gt=0, description="Global requests limit"
     )
-    rate_limit_skip_paths: list[str] = Field(
-        default_factory=lambda: ["/health", "/metrics"],
+    rate_limit_skip_paths: frozenset[str] = Field(
+        default=frozenset({"/health", "/metrics"}),
         description="Paths to skip rate limiting",
     )
 
@@ -148,11 +175,26 @@ class MiddlewareConfig(BaseModel):
     logging_max_body_size: int = Field(
         default=1024, ge=0, description="Max body size to log"
     )
-    logging_sensitive_headers: list[str] = Field(
-        default_factory=lambda: ["authorization", "x-api-key", "cookie", "set-cookie"],
+    logging_sensitive_headers: frozenset[str] = Field(
+        default=frozenset({"authorization", "x-api-key", "cookie", "set-cookie"}),
         description="Headers to redact from logs",
     )
 
+    @field_validator("logging_sensitive_headers")
+    @classmethod
+    def lowercase_sensitive_headers(cls, v: frozenset[str]) -> frozenset[str]:
+        """Normalize header names once so lookups only lowercase the request side."""
+        return frozenset(header.lower() for header in v)
+
+
+# Shared default instances; the models are frozen so these are safe to reuse
+_DEFAULT_CACHE = CacheConfig()
+_DEFAULT_RETRY = RetryConfig()
+_DEFAULT_ROUTER = RouterSettings()
+_DEFAULT_MERGER = MergerSettings()
+_DEFAULT_MIDDLEWARE = MiddlewareConfig()
+_DEFAULT_PROVIDER = ProviderSettings()
+
 
 class AppSettings(BaseSettings):
     """Main application settings with modern Pydantic v2 patterns."""
@@ -163,8 +205,7 @@ class AppSettings(BaseSettings):
         env_nested_delimiter="__",
         case_sensitive=False,
         extra="ignore",
-        validate_assignment=True,
-        validate_default=True,
+        frozen=True,
     )
 
     # Application metadata
@@ -199,71 +240,84 @@ class AppSettings(BaseSettings):
     )
 
     # Nested configurations
-    cache: CacheConfig = Field(
-        default_factory=CacheConfig, description="Cache settings"
-    )
-    retry: RetryConfig = Field(
-        default_factory=RetryConfig, description="Retry settings"
-    )
+    cache: CacheConfig = Field(default=_DEFAULT_CACHE, description="Cache settings")
+    retry: RetryConfig = Field(default=_DEFAULT_RETRY, description="Retry settings")
     router: RouterSettings = Field(
-        default_factory=RouterSettings, description="Router settings"
+        default=_DEFAULT_ROUTER, description="Router settings"
     )
     merger: MergerSettings = Field(
-        default_factory=MergerSettings, description="Merger settings"
+        default=_DEFAULT_MERGER, description="Merger settings"
     )
     middleware: MiddlewareConfig = Field(
-        default_factory=MiddlewareConfig, description="Middleware settings"
+        default=_DEFAULT_MIDDLEWARE, description="Middleware settings"
     )
 
     # Provider configurations
     linkup: ProviderSettings = Field(
-        default_factory=ProviderSettings, description="Linkup provider"
-    )
-    exa: ProviderSettings = Field(
-        default_factory=ProviderSettings, description="Exa provider"
+        default=_DEFAULT_PROVIDER, description="Linkup provider"
     )
+    exa: ProviderSettings = Field(default=_DEFAULT_PROVIDER, description="Exa provider")
     perplexity: ProviderSettings = Field(
-        default_factory=ProviderSettings, description="Perplexity provider"
+        default=_DEFAULT_PROVIDER, description="Perplexity provider"
     )
     tavily: ProviderSettings = Field(
-        default_factory=ProviderSettings, description="Tavily provider"
+        default=_DEFAULT_PROVIDER, description="Tavily provider"
     )
     firecrawl: ProviderSettings = Field(
-        default_factory=ProviderSettings, description="Firecrawl provider"
+        default=_DEFAULT_PROVIDER, description="Firecrawl provider"
     )
 
     @field_validator("environment")
     @classmethod
     def validate_environment(cls, v: str) -> str:
         """Validate environment value."""
-        valid_envs = {"development", "staging", "production", "test"}
-        if v.lower() not in valid_envs:
-            raise ValueError(f"Invalid environment: {v}. Must be one of {valid_envs}")
-        return v.lower()
+        env = v.lower()
+        if env not in _VALID_ENVIRONMENTS:
+            raise ValueError(
+                f"Invalid environment: {v}. Must be one of {set(_VALID_ENVIRONMENTS)}"
+            )
+        return env
 
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level."""
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if v.upper() not in valid_levels:
-            raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
-        return v.upper()
+        level = v.upper()
+        if level not in _VALID_LOG_LEVELS:
+            raise ValueError(
+                f"Invalid log level: {v}. Must be one of {set(_VALID_LOG_LEVELS)}"
+            )
+        return level
 
     def get_provider_config(self, provider_name: str) -> ProviderSettings | None:
         """Get configuration for a specific provider."""
-        return getattr(self, provider_name.lower(), None)
+        name = provider_name.lower()
+        return getattr(self, name) if name in _PROVIDER_NAMES else None
 
     def get_enabled_providers(self) -> list[str]:
         """Get list of enabled provider names."""
-        providers = ["linkup", "exa", "perplexity", "tavily", "firecrawl"]
-        return [p for p in providers if getattr(self, p).enabled]
+        return [name for name in _PROVIDER_NAMES if getattr(self, name).enabled]
+
+
+_settings: AppSettings | None = None
 
 
-@lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
-    """Get cached application settings."""
-    return AppSettings()
+    """Get cached application settings.
+
+    Settings are built on first use rather than at import time so that
+    environment overrides applied by ``main()`` are picked up.
+    """
+    global _settings  # noqa: PLW0603
+    if _settings is None:
+        _settings = AppSettings()
+    return _settings
+
+
+def reset_settings_cache() -> None:
+    """Discard cached settings so the next ``get_settings()`` reloads them."""
+    global _settings  # noqa: PLW0603
+    _settings = None
 
 
 # Alias for compatibility
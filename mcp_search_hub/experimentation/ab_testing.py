@@ -1,14 +1,22 @@
 """A/B testing framework for evaluating different search configurations."""
 
+import asyncio
+import atexit
+import bisect
 import hashlib
-import json
 import logging
 import os
 import random
+import threading
 import time
+import weakref
+from collections import defaultdict, deque
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
 import numpy as np
@@ -19,6 +27,55 @@ from ..models.results import SearchResponse
 
 logger = logging.getLogger(__name__)
 
+# Size of the bucketing hash space (64-bit digests)
+_HASH_SPACE = 2**64
+
+# Number of buckets used for traffic-percentage inclusion
+_TRAFFIC_BUCKETS = 10_000
+
+# Result files are sharded per experiment by hour, e.g. 2025052114.jsonl
+_RESULT_SHARD_FORMAT = "%Y%m%d%H"
+
+# Latency percentiles reported by analyze_experiment
+_LATENCY_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+@lru_cache(maxsize=1024)
+def _salted_hasher(experiment_id: str, variable: str) -> hashlib.blake2b:
+    """Return a BLAKE2b hasher pre-seeded with an experiment/variable salt.
+
+    Following PlanOut, each (experiment, variable) pair gets its own salt so
+    traffic inclusion and variant assignment bucket independently of each
+    other and of other experiments. The salt prefix is absorbed once; callers
+    copy the hasher instead of rebuilding the salted string.
+    """
+    return hashlib.blake2b(f"{experiment_id}.{variable}.".encode(), digest_size=8)
+
+
+@lru_cache(maxsize=8192)
+def _unit_hash(unit: str, experiment_id: str, variable: str) -> int:
+    """Hash an assignment unit (query text or user ID) to a 64-bit integer.
+
+    BLAKE2b with an 8-byte digest is much cheaper than MD5 plus a hex round
+    trip. The hash is pure, so repeated queries are served from the cache;
+    experiment state such as weights or dates is applied by the callers and
+    never cached here.
+    """
+    hasher = _salted_hasher(experiment_id, variable).copy()
+    hasher.update(unit.encode())
+    return int.from_bytes(hasher.digest(), "big")
+
+
+# Managers that have not been closed yet; one atexit hook serves them all
+_open_managers: "weakref.WeakSet[ABTestingManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_managers() -> None:
+    """Write the buffered results of every live manager at interpreter exit."""
+    for manager in list(_open_managers):
+        manager.close()
+
 
 class ExperimentVariant(BaseModel):
     """A variant in an A/B test experiment."""
@@ -88,6 +145,11 @@ class ABTestingManager:
         storage_dir: str | None = None,
         assignment_strategy: Assignment = Assignment.DETERMINISTIC,
         enable_shadow_testing: bool = True,
+        *,
+        result_batch_size: int = 100,
+        result_flush_interval: float = 5.0,
+        max_shadow_concurrency: int = 4,
+        max_in_memory_results: int = 10_000,
     ):
         """Initialize the A/B testing manager.
 
@@ -95,6 +157,15 @@ class ABTestingManager:
             storage_dir: Directory to store experiment data
             assignment_strategy: Strategy for assigning traffic to variants
             enable_shadow_testing: Whether to run shadow tests
+            result_batch_size: Number of buffered results that triggers a write
+            result_flush_interval: Seconds after which buffered results are
+                written even if the batch is not full. A timer enforces this
+                on the running event loop; without one it is checked when the
+                next result is recorded, and close() writes whatever is left
+            max_shadow_concurrency: Maximum variants executed at once by a
+                shadow test
+            max_in_memory_results: Most recent results kept in memory per
+                experiment; older ones remain available on disk
         """
         self.storage_dir = storage_dir or os.path.join(
             os.path.dirname(os.path.abspath(__file__)), "experiments"
@@ -102,8 +173,36 @@ class ABTestingManager:
         self.assignment_strategy = assignment_strategy
         self.enable_shadow_testing = enable_shadow_testing
         self.experiments: dict[str, Experiment] = {}
-        self.results: dict[str, list[ExperimentResult]] = {}
+        self.max_in_memory_results = max_in_memory_results
+        self.results: dict[str, deque[ExperimentResult]] = {}
+        # Per experiment: the variant weights a table was built from, the
+        # normalized cumulative weights for bisection, and whether the split
+        # is two equally weighted variants
+        self._weight_tables: dict[str, tuple[tuple[float, ...], list[float], bool]] = {}
+        # Serialized results waiting to be appended to storage
+        self.result_batch_size = result_batch_size
+        self.result_flush_interval = result_flush_interval
+        # Entries are (experiment ID, hourly shard name, JSON line)
+        self._pending_results: list[tuple[str, str, str]] = []
+        self._last_flush = time.monotonic()
+        # Timer enforcing the flush interval, and the loop it was armed on
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._flush_timer_loop: asyncio.AbstractEventLoop | None = None
+        self._write_lock = threading.Lock()
+        # Background writes still in flight, joined before results are read
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ab-results-writer"
+        )
+        self._pending_writes: set[Future] = set()
+        self._closed = False
+        # Bounds provider load when shadow-testing many variants at once;
+        # created on first use, for the loop the shadow tests run on
+        self.max_shadow_concurrency = max_shadow_concurrency
+        self._shadow_semaphore: asyncio.Semaphore | None = None
+        self._shadow_loop: asyncio.AbstractEventLoop | None = None
         self._initialize()
+        # Buffered results must not be lost if close() is never called
+        _open_managers.add(self)
 
     def _initialize(self):
         """Initialize the testing framework."""
@@ -116,16 +215,17 @@ class ABTestingManager:
         os.makedirs(experiment_path, exist_ok=True)
 
         # Load experiment files
-        for filename in os.listdir(experiment_path):
-            if filename.endswith(".json"):
+        with os.scandir(experiment_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
                 try:
-                    with open(os.path.join(experiment_path, filename)) as f:
-                        experiment_data = json.load(f)
-                        experiment = Experiment(**experiment_data)
-                        self.experiments[experiment.id] = experiment
-                        logger.info(f"Loaded experiment: {experiment.id}")
+                    with open(entry.path, "rb") as f:
+                        experiment = Experiment.model_validate_json(f.read())
+                    self.experiments[experiment.id] = experiment
+                    logger.info(f"Loaded experiment: {experiment.id}")
                 except Exception as e:
-                    logger.error(f"Error loading experiment {filename}: {e}")
+                    logger.error(f"Error loading experiment {entry.name}: {e}")
 
     def _save_experiment(self, experiment: Experiment):
         """Save experiment definition to storage."""
@@ -140,26 +240,132 @@ class ABTestingManager:
             logger.error(f"Error saving experiment {experiment.id}: {e}")
 
     def _save_result(self, experiment_id: str, result: ExperimentResult):
-        """Save experiment result to storage."""
-        results_path = os.path.join(self.storage_dir, "results", experiment_id)
-        os.makedirs(results_path, exist_ok=True)
+        """Record an experiment result and queue it for storage.
+
+        Results are buffered and appended to an hourly JSONL file in batches,
+        so the query path does not open a new file for every result.
+        """
+        # Add to in-memory results
+        if experiment_id not in self.results:
+            self.results[experiment_id] = deque(maxlen=self.max_in_memory_results)
+        self.results[experiment_id].append(result)
+
+        # Exclude the response to save space (skipped by the serializer, so
+        # it is neither copied nor walked). The shard follows the result's own
+        # timestamp, not the time the batch happens to be written.
+        self._pending_results.append(
+            (
+                experiment_id,
+                f"{result.timestamp:{_RESULT_SHARD_FORMAT}}",
+                result.model_dump_json(exclude={"response"}),
+            )
+        )
+
+        if (
+            len(self._pending_results) >= self.result_batch_size
+            or time.monotonic() - self._last_flush >= self.result_flush_interval
+        ):
+            self._flush_pending(background=True)
+        else:
+            self._schedule_flush()
 
-        # Generate a unique filename based on timestamp
-        filename = f"{int(time.time())}_{result.variant_id}.json"
+    def _schedule_flush(self):
+        """Arm a timer that writes the buffer once the flush interval passes.
 
+        A timer armed on a loop that has since stopped never fires, so one is
+        only reused if it belongs to the running loop.
+        """
         try:
-            with open(os.path.join(results_path, filename), "w") as f:
-                # Exclude the response to save space
-                result_copy = result.model_copy(deep=True)
-                result_copy.response = None
-                f.write(result_copy.model_dump_json(indent=2))
-
-            # Add to in-memory results
-            if experiment_id not in self.results:
-                self.results[experiment_id] = []
-            self.results[experiment_id].append(result)
-        except Exception as e:
-            logger.error(f"Error saving result for experiment {experiment_id}: {e}")
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._flush_timer is not None and self._flush_timer_loop is loop:
+            return
+        self._flush_timer = loop.call_later(
+            self.result_flush_interval, self._on_flush_timer
+        )
+        self._flush_timer_loop = loop
+
+    def _on_flush_timer(self):
+        """Write the buffer when the flush interval timer fires."""
+        self._flush_timer = self._flush_timer_loop = None
+        self._flush_pending(background=True)
+
+    def flush_results(self):
+        """Write all buffered experiment results to storage.
+
+        Also waits for background writes already in flight, so everything
+        recorded so far is on disk when this returns. Those writes hold older
+        results, so they are joined before the remaining batch is appended.
+        """
+        wait(list(self._pending_writes))
+        self._flush_pending(background=False)
+
+    def close(self):
+        """Write buffered results to storage and stop the writer thread.
+
+        Call when shutting down. Results recorded afterwards are written
+        synchronously.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.flush_results()
+        self._writer.shutdown(wait=True)
+        _open_managers.discard(self)
+
+    def _flush_pending(self, background: bool):
+        """Hand the buffered results to the writer.
+
+        Args:
+            background: Write on the writer thread when called from a
+                running event loop instead of blocking the caller
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = self._flush_timer_loop = None
+        batch, self._pending_results = self._pending_results, []
+        self._last_flush = time.monotonic()
+        if not batch:
+            return
+
+        if background:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if loop is not None and not self._closed:
+                future = self._writer.submit(self._write_results, batch)
+                self._pending_writes.add(future)
+                future.add_done_callback(self._write_done)
+                return
+
+        self._write_results(batch)
+
+    def _write_done(self, future: Future):
+        """Forget a finished background write, logging it if it failed."""
+        self._pending_writes.discard(future)
+        exc = future.exception()
+        if exc is not None:
+            logger.error(f"Error writing experiment results: {exc}")
+
+    def _write_results(self, batch: list[tuple[str, str, str]]):
+        """Append serialized results to their experiment's hourly JSONL files."""
+        lines_by_shard: dict[tuple[str, str], list[str]] = defaultdict(list)
+        for experiment_id, shard, line in batch:
+            lines_by_shard[experiment_id, shard].append(line)
+
+        with self._write_lock:
+            for (experiment_id, shard), lines in lines_by_shard.items():
+                results_path = os.path.join(self.storage_dir, "results", experiment_id)
+                try:
+                    os.makedirs(results_path, exist_ok=True)
+                    with open(os.path.join(results_path, f"{shard}.jsonl"), "a") as f:
+                        f.write("\n".join(lines) + "\n")
+                except Exception as e:
+                    logger.error(
+                        f"Error saving results for experiment {experiment_id}: {e}"
+                    )
 
     def create_experiment(
         self,
@@ -218,6 +424,9 @@ class ABTestingManager:
             metadata=metadata or {},
         )
 
+        # Validates the weights before anything is stored
+        self._weight_table(experiment)
+
         # Save the experiment
         self.experiments[experiment_id] = experiment
         self._save_experiment(experiment)
@@ -283,6 +492,66 @@ class ABTestingManager:
         self._save_experiment(experiment)
         return True
 
+    def _weight_table(self, experiment: Experiment) -> tuple[list[float], bool]:
+        """Get normalized cumulative variant weights for an experiment.
+
+        Tables are cached per experiment and rebuilt whenever the variant
+        weights differ from the ones a table was built from, so edits to an
+        experiment take effect on the next assignment.
+
+        Returns:
+            Tuple of (cumulative weights, whether the split is an equal A/B split)
+
+        Raises:
+            ValueError: If the variant weights do not sum to a positive number
+        """
+        weights = tuple(v.weight for v in experiment.variants)
+        cached = self._weight_tables.get(experiment.id)
+        if cached is not None and cached[0] == weights:
+            return cached[1], cached[2]
+
+        total_weight = sum(weights)
+        if total_weight <= 0:
+            raise ValueError(
+                f"Experiment {experiment.id} needs at least one variant with a "
+                f"positive weight, got weights {list(weights)}"
+            )
+        cum_weights = []
+        cumulative_weight = 0.0
+        for weight in weights:
+            cumulative_weight += weight
+            cum_weights.append(cumulative_weight / total_weight)
+
+        # Standard two-variant 50/50 splits take the hash fast path
+        equal_split = len(weights) == 2 and weights[0] == weights[1]
+        self._weight_tables[experiment.id] = (weights, cum_weights, equal_split)
+        return cum_weights, equal_split
+
+    def _pick_variant(
+        self,
+        experiment: Experiment,
+        normalized_val: float,
+        cum_weights: list[float] | None = None,
+    ) -> ExperimentVariant:
+        """Map a value in [0, 1) to a variant according to the variant weights."""
+        if cum_weights is None:
+            cum_weights, _ = self._weight_table(experiment)
+        idx = bisect.bisect_right(cum_weights, normalized_val)
+        # Guard against float rounding leaving the last bound just below 1.0
+        return experiment.variants[min(idx, len(experiment.variants) - 1)]
+
+    def _assign_by_hash(
+        self, experiment: Experiment, hash_val: int
+    ) -> ExperimentVariant:
+        """Map a 64-bit unit hash to a variant according to the variant weights."""
+        cum_weights, equal_split = self._weight_table(experiment)
+        if equal_split:
+            # The top bit selects the same variant as the cumulative-weight
+            # lookup would, without any float arithmetic
+            return experiment.variants[hash_val >> 63]
+        # Normalize to 0-1 range
+        return self._pick_variant(experiment, hash_val / _HASH_SPACE, cum_weights)
+
     def assign_variant(
         self,
         experiment: Experiment,
@@ -301,46 +570,16 @@ class ABTestingManager:
         """
         if self.assignment_strategy == Assignment.RANDOM:
             # Random assignment based on variant weights
-            weights = [v.weight for v in experiment.variants]
-            # Normalize weights
-            total_weight = sum(weights)
-            normalized_weights = [w / total_weight for w in weights]
-            return random.choices(experiment.variants, weights=normalized_weights)[0]
+            return self._pick_variant(experiment, random.random())
 
         if self.assignment_strategy == Assignment.USER_ID and user_id:
             # Deterministic assignment based on user ID
-            hash_val = int(hashlib.md5(user_id.encode()).hexdigest(), 16)
-            # Normalize to 0-1 range
-            normalized_val = hash_val / (2**128)
-
-            # Map to a variant based on weights
-            cumulative_weight = 0
-            total_weight = sum(v.weight for v in experiment.variants)
-            for variant in experiment.variants:
-                cumulative_weight += variant.weight / total_weight
-                if normalized_val < cumulative_weight:
-                    return variant
-
-            # Fallback to last variant
-            return experiment.variants[-1]
+            hash_val = _unit_hash(user_id, experiment.id, "assignment")
+            return self._assign_by_hash(experiment, hash_val)
 
         # Default to deterministic based on query
-        # Deterministic assignment based on query
-        query_hash = hashlib.md5(query.query.encode()).hexdigest()
-        hash_val = int(query_hash, 16)
-        # Normalize to 0-1 range
-        normalized_val = hash_val / (2**128)
-
-        # Map to a variant based on weights
-        cumulative_weight = 0
-        total_weight = sum(v.weight for v in experiment.variants)
-        for variant in experiment.variants:
-            cumulative_weight += variant.weight / total_weight
-            if normalized_val < cumulative_weight:
-                return variant
-
-        # Fallback to last variant
-        return experiment.variants[-1]
+        hash_val = _unit_hash(query.query, experiment.id, "assignment")
+        return self._assign_by_hash(experiment, hash_val)
 
     def should_include_in_experiment(
         self, experiment: Experiment, query: SearchQuery
@@ -367,14 +606,14 @@ class ABTestingManager:
 
         # Apply traffic percentage
         if experiment.traffic_percentage < 100.0:
-            # Generate a consistent hash for the query
-            query_hash = hashlib.md5(query.query.encode()).hexdigest()
-            hash_val = int(query_hash, 16)
-            # Normalize to 0-100 range
-            normalized_val = (hash_val % 100) + (hash_val % 100) / 100
+            # Generate a consistent hash for the query, salted separately from
+            # variant assignment so inclusion does not skew the variant split
+            hash_val = _unit_hash(query.query, experiment.id, "inclusion")
+            # Map to one of 10,000 buckets (0.01% traffic granularity)
+            bucket = hash_val % _TRAFFIC_BUCKETS
 
             # Check if within traffic percentage
-            return normalized_val < experiment.traffic_percentage
+            return bucket < experiment.traffic_percentage * (_TRAFFIC_BUCKETS / 100)
 
         return True
 
@@ -412,7 +651,7 @@ class ABTestingManager:
         variant = self.assign_variant(experiment, query, user_id)
 
         # Execute the variant
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             response = await execute_fn(query, variant.config)
             error = None
@@ -422,7 +661,7 @@ class ABTestingManager:
             error = str(e)
 
         # Calculate latency
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         # Create experiment result
         result = ExperimentResult(
@@ -469,10 +708,37 @@ class ABTestingManager:
         if not self.should_include_in_experiment(experiment, query):
             return
 
-        # Run all variants as shadow tests
-        for variant in experiment.variants:
+        # Run all variants as shadow tests concurrently
+        await asyncio.gather(
+            *(
+                self._run_one_shadow(experiment_id, variant, query, execute_fn)
+                for variant in experiment.variants
+            )
+        )
+
+    def _get_shadow_semaphore(self) -> asyncio.Semaphore:
+        """Return the shadow-test semaphore for the running event loop.
+
+        asyncio primitives bind to the first loop that waits on them, so a
+        fresh semaphore is created when the manager moves to another loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._shadow_loop is not loop:
+            self._shadow_semaphore = asyncio.Semaphore(self.max_shadow_concurrency)
+            self._shadow_loop = loop
+        return self._shadow_semaphore
+
+    async def _run_one_shadow(
+        self,
+        experiment_id: str,
+        variant: ExperimentVariant,
+        query: SearchQuery,
+        execute_fn: Callable[[SearchQuery, dict[str, Any]], SearchResponse],
+    ) -> None:
+        """Execute a single shadow-test variant and record its result."""
+        async with self._get_shadow_semaphore():
             # Execute the variant
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 response = await execute_fn(query, variant.config)
                 error = None
@@ -482,24 +748,24 @@ class ABTestingManager:
                 error = str(e)
 
             # Calculate latency
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Create experiment result
-            result = ExperimentResult(
-                variant_id=variant.id,
-                query=query.query,
-                response=response,
-                metrics={
-                    "latency_ms": latency_ms,
-                    "result_count": len(response.results) if response else 0,
-                    "is_shadow": True,
-                },
-                error=error,
-                latency_ms=latency_ms,
-            )
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+        # Create experiment result
+        result = ExperimentResult(
+            variant_id=variant.id,
+            query=query.query,
+            response=response,
+            metrics={
+                "latency_ms": latency_ms,
+                "result_count": len(response.results) if response else 0,
+                "is_shadow": True,
+            },
+            error=error,
+            latency_ms=latency_ms,
+        )
 
-            # Save result
-            self._save_result(experiment_id, result)
+        # Save result
+        self._save_result(experiment_id, result)
 
     def get_results(
         self, experiment_id: str, limit: int = 1000
@@ -513,8 +779,48 @@ class ABTestingManager:
         Returns:
             List of experiment results
         """
-        results = self.results.get(experiment_id, [])
-        return results[-limit:] if limit < len(results) else results
+        results = self.results.get(experiment_id)
+        if not results:
+            return []
+        # Walk back from the newest entry so only `limit` items are visited
+        tail = list(islice(reversed(results), limit))
+        tail.reverse()
+        return tail
+
+    def load_results_from_disk(
+        self, experiment_id: str, since: datetime | None = None
+    ) -> list[ExperimentResult]:
+        """Load stored results for an experiment.
+
+        Args:
+            experiment_id: ID of the experiment to load results for
+            since: Only read hourly shards starting at or after this time
+
+        Returns:
+            List of experiment results in chronological order (without responses)
+        """
+        self.flush_results()
+
+        results_path = os.path.join(self.storage_dir, "results", experiment_id)
+        if not os.path.isdir(results_path):
+            return []
+
+        min_shard = f"{since:{_RESULT_SHARD_FORMAT}}" if since else ""
+        with os.scandir(results_path) as entries:
+            shards = sorted(
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".jsonl")
+                and entry.name.removesuffix(".jsonl") >= min_shard
+            )
+
+        results = []
+        for shard in shards:
+            with open(shard, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        results.append(ExperimentResult.model_validate_json(line))
+        return results
 
     def analyze_experiment(self, experiment_id: str) -> dict[str, Any]:
         """Analyze the results of an experiment.
@@ -533,45 +839,50 @@ class ABTestingManager:
         if not results:
             return {"error": f"No results found for experiment {experiment_id}"}
 
-        # Group results by variant
-        variant_results = {}
-        for variant in experiment.variants:
-            variant_results[variant.id] = [
-                r for r in results if r.variant_id == variant.id
-            ]
+        # Group results by variant in a single pass
+        variant_results: dict[str, list[ExperimentResult]] = {
+            variant.id: [] for variant in experiment.variants
+        }
+        for r in results:
+            if r.variant_id in variant_results:
+                variant_results[r.variant_id].append(r)
 
         # Calculate metrics for each variant
         metrics = {}
         for variant_id, variant_results_list in variant_results.items():
-            if not variant_results_list:
+            count = len(variant_results_list)
+            if not count:
                 metrics[variant_id] = {"error": "No results"}
                 continue
 
-            # Calculate average latency
-            latencies = [r.latency_ms for r in variant_results_list]
-            avg_latency = sum(latencies) / len(latencies)
-
-            # Calculate result counts
-            result_counts = [
-                len(r.response.results) if r.response else 0
-                for r in variant_results_list
-            ]
-            avg_result_count = sum(result_counts) / len(result_counts)
-
-            # Calculate error rate
+            latencies = np.fromiter(
+                (r.latency_ms for r in variant_results_list),
+                dtype=np.float64,
+                count=count,
+            )
+            result_counts = np.fromiter(
+                (
+                    len(r.response.results) if r.response else 0
+                    for r in variant_results_list
+                ),
+                dtype=np.int64,
+                count=count,
+            )
             error_count = sum(1 for r in variant_results_list if r.error)
-            error_rate = error_count / len(variant_results_list)
+
+            # All percentiles from a single sort of the latencies
+            p50, p90, p95, p99 = np.quantile(latencies, _LATENCY_QUANTILES)
 
             # Calculate other metrics (can be expanded)
             metrics[variant_id] = {
-                "count": len(variant_results_list),
-                "avg_latency_ms": avg_latency,
-                "avg_result_count": avg_result_count,
-                "error_rate": error_rate,
-                "p50_latency_ms": np.percentile(latencies, 50),
-                "p90_latency_ms": np.percentile(latencies, 90),
-                "p95_latency_ms": np.percentile(latencies, 95),
-                "p99_latency_ms": np.percentile(latencies, 99),
+                "count": count,
+                "avg_latency_ms": float(latencies.mean()),
+                "avg_result_count": float(result_counts.mean()),
+                "error_rate": error_count / count,
+                "p50_latency_ms": p50,
+                "p90_latency_ms": p90,
+                "p95_latency_ms": p95,
+                "p99_latency_ms": p99,
             }
 
         # Create summary
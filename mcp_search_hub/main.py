@@ -24,9 +24,36 @@ import os
 import signal
 from typing import NoReturn
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
 from .config import get_settings
 from .server import SearchServer
-from .utils.logging import configure_logging
+from .utils.logging import configure_logging, get_logger
+
+logger = get_logger(__name__)
+
+
+def install_uvloop() -> bool:
+    """Use uvloop's event loop for the server when it is installed.
+
+    The request path awaits through several middleware layers and provider
+    calls, so the faster C event loop (task scheduling, futures, selectors)
+    speeds up every request without any change to the async code itself.
+
+    Returns:
+        True if uvloop was installed as the event loop policy
+    """
+    if not UVLOOP_AVAILABLE:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 
 async def shutdown(server: SearchServer) -> None:
@@ -168,6 +195,10 @@ def main() -> NoReturn:
     # Configure logging early based on settings
     configure_logging(settings.log_level)
 
+    # Switch to uvloop before any event loop is created
+    if install_uvloop():
+        logger.info("Using uvloop event loop")
+
     server = SearchServer()
 
     # Setup signal handlers for graceful shutdown
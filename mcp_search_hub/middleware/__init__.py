@@ -4,12 +4,14 @@ This package contains middleware components that provide cross-cutting
 functionality such as authentication, rate limiting, logging, retry logic,
 and error handling.
 
-All middleware use standard Starlette BaseHTTPMiddleware patterns and work
-directly with FastMCP's built-in middleware support.
+Middleware either use Starlette's BaseHTTPMiddleware or, on hot paths, are
+plain ASGI callables; both work directly with FastMCP's built-in middleware
+support.
 """
 
 # Import middleware components
 from .auth import AuthMiddleware
+from .combined import CombinedAuthErrorMiddleware
 from .error_handler import ErrorHandlerMiddleware
 from .logging import LoggingMiddleware
 from .rate_limit import RateLimitMiddleware
@@ -17,6 +19,7 @@ from .retry import RetryMiddleware
 
 __all__ = [
     "AuthMiddleware",
+    "CombinedAuthErrorMiddleware",
     "ErrorHandlerMiddleware",
     "LoggingMiddleware",
     "RateLimitMiddleware",
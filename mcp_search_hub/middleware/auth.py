@@ -1,22 +1,43 @@
 """Authentication middleware for MCP Search Hub."""
 
+import hashlib
 import os
-from collections.abc import Callable
+from functools import lru_cache
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from ..utils.errors import AuthenticationError
+from ..utils.errors import (
+    WWW_AUTHENTICATE_HEADER,
+    AuthenticationError,
+    http_error_response,
+)
 from ..utils.logging import get_logger
+from ..utils.serialization import render_json
+from .paths import SkipPathMatcher
 
 logger = get_logger(__name__)
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """Middleware to handle API key authentication for HTTP requests."""
+def _key_digest(api_key: bytes) -> bytes:
+    """Hash an API key so keys are only ever compared as SHA-256 digests."""
+    return hashlib.sha256(api_key).digest()
 
-    def __init__(self, app, **options):
+
+@lru_cache(maxsize=256)
+def _token_digest(header_value: bytes) -> bytes:
+    """Strip an optional ``Bearer`` scheme from a raw header value and hash it.
+
+    Clients resend the same token on every request, so the result is cached.
+    """
+    if header_value[:7].lower() == b"bearer ":
+        header_value = header_value[7:]
+    return _key_digest(header_value)
+
+
+class AuthMiddleware:
+    """Pure ASGI middleware to handle API key authentication for HTTP requests."""
+
+    def __init__(self, app: ASGIApp, **options):
         """Initialize authentication middleware.
 
         Args:
@@ -25,14 +46,19 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 - api_keys: Optional list of valid API keys
                 - skip_auth_paths: List of paths that don't require authentication
         """
-        super().__init__(app)
+        self.app = app
 
         # Get API keys from options or environment
-        self.api_keys = options.get("api_keys", [])
-        if not self.api_keys:
+        api_keys = options.get("api_keys")
+        if not api_keys:
             api_key = os.getenv("MCP_SEARCH_HUB_API_KEY")
-            if api_key:
-                self.api_keys = [api_key]
+            api_keys = [api_key] if api_key else []
+        self.api_keys = frozenset(api_keys)
+        # Keys are matched by digest: lookup time depends only on the hash of
+        # the presented token, never on how much of a real key it shares
+        self._key_digests = frozenset(
+            _key_digest(key.encode("latin-1")) for key in self.api_keys
+        )
 
         # Paths that don't require authentication
         self.skip_auth_paths = options.get(
@@ -40,47 +66,79 @@ class AuthMiddleware(BaseHTTPMiddleware):
             ["/health", "/metrics", "/docs", "/redoc", "/openapi.json"],
         )
 
+        self._is_skipped = SkipPathMatcher(self.skip_auth_paths)
+
+        # The rejection is the same for every request, so render it once
+        error_dict = http_error_response(
+            AuthenticationError(message="Invalid or missing API key")
+        )
+        self._error_status = error_dict.pop("status_code")
+        self._error_body = render_json(error_dict)
+        self._error_headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self._error_body)).encode()),
+            WWW_AUTHENTICATE_HEADER,
+        ]
+
         logger.info(
-            f"Authentication middleware initialized with "
-            f"{len(self.api_keys)} API keys and {len(self.skip_auth_paths)} skipped paths"
+            "Authentication middleware initialized with %d API keys and %d skipped paths",
+            len(self.api_keys),
+            len(self.skip_auth_paths),
         )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process HTTP requests for authentication.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Authenticate HTTP requests before passing them downstream.
 
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware or handler
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        # Only HTTP requests are authenticated; lifespan etc. pass straight through
+        if scope["type"] != "http" or self.is_authenticated(scope):
+            await self.app(scope, receive, send)
+        else:
+            await self.reject(send)
 
-        Returns:
-            The response from downstream
+    def is_authenticated(self, scope: Scope) -> bool:
+        """Check whether an HTTP request may proceed.
+
+        Args:
+            scope: ASGI HTTP connection scope
 
-        Raises:
-            AuthenticationError: If authentication fails
+        Returns:
+            True if auth is disabled, skipped for the path, or the key is valid
         """
-        # Skip authentication if no API keys are configured
         if not self.api_keys:
-            return await call_next(request)
+            return True
 
         # Skip authentication for allowed paths
-        if any(request.url.path.startswith(path) for path in self.skip_auth_paths):
-            return await call_next(request)
-
-        # Get API key from header - case insensitive
-        api_key = (
-            request.headers.get("X-API-Key")
-            or request.headers.get("x-api-key")
-            or request.headers.get("Authorization")
-            or request.headers.get("authorization")
-        )
-        if api_key and api_key.lower().startswith("bearer "):
-            api_key = api_key[7:]  # Remove 'Bearer ' prefix
+        path = scope["path"]
+        if self._is_skipped(path):
+            return True
+
+        # One pass over the raw headers; ASGI names are already lowercased bytes
+        api_key = authorization = None
+        for name, value in scope["headers"]:
+            if name == b"x-api-key":
+                api_key = value
+            elif name == b"authorization":
+                authorization = value
+        token = api_key or authorization
 
         # Validate API key
-        if not api_key or api_key not in self.api_keys:
-            logger.warning(f"Authentication failed for request to {request.url.path}")
-            raise AuthenticationError(
-                message="Invalid or missing API key",
-            )
-
-        return await call_next(request)
+        if not token or _token_digest(token) not in self._key_digests:
+            logger.warning("Authentication failed for request to %s", path)
+            return False
+        return True
+
+    async def reject(self, send: Send) -> None:
+        """Send a 401 JSON error response without materializing a Response."""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self._error_status,
+                "headers": self._error_headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": self._error_body})
@@ -0,0 +1,50 @@
+"""Combined authentication and error handling middleware for MCP Search Hub."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ..utils.logging import get_logger
+from .auth import AuthMiddleware
+from .error_handler import ErrorHandlerMiddleware
+
+logger = get_logger(__name__)
+
+
+class CombinedAuthErrorMiddleware(ErrorHandlerMiddleware):
+    """Pure ASGI middleware doing authentication and error handling in one layer.
+
+    Behaves like ``ErrorHandlerMiddleware`` wrapping ``AuthMiddleware`` but
+    adds a single layer to the stack, so each request makes one middleware
+    call instead of two.
+    """
+
+    def __init__(self, app: ASGIApp, **options):
+        """Initialize combined middleware.
+
+        Args:
+            app: ASGI application
+            **options: Configuration options accepted by ``AuthMiddleware``
+                (api_keys, skip_auth_paths) and ``ErrorHandlerMiddleware``
+                (include_traceback, redact_sensitive_data)
+        """
+        super().__init__(app, **options)
+        auth_options = {
+            key: options[key]
+            for key in ("api_keys", "skip_auth_paths")
+            if key in options
+        }
+        self.auth = AuthMiddleware(app, **auth_options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Authenticate HTTP requests and handle downstream errors.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+        elif self.auth.is_authenticated(scope):
+            await self.call_with_error_handling(scope, receive, send)
+        else:
+            await self.auth.reject(send)
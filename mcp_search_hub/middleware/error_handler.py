@@ -5,22 +5,32 @@ components and response formatting for consistent error responses.
 """
 
 import traceback
-from collections.abc import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from ..utils.errors import ProviderRateLimitError, SearchError, http_error_response
+from ..utils.errors import (
+    WWW_AUTHENTICATE_HEADER,
+    AuthenticationError,
+    ProviderRateLimitError,
+    SearchError,
+    http_error_response,
+)
 from ..utils.logging import get_logger
+from ..utils.serialization import render_json
 
 logger = get_logger(__name__)
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """Middleware for consistent error handling and formatting."""
+class ErrorHandlerMiddleware:
+    """Pure ASGI middleware for consistent error handling and formatting."""
 
-    def __init__(self, app, **options):
+    # Header names and fixed headers are encoded once rather than per error
+    _CONTENT_LENGTH = b"content-length"
+    _RETRY_AFTER = b"x-ratelimit-retry-after"
+    _JSON_HEADERS = ((b"content-type", b"application/json"),)
+    _UNAUTHORIZED_HEADERS = (*_JSON_HEADERS, WWW_AUTHENTICATE_HEADER)
+
+    def __init__(self, app: ASGIApp, **options):
         """Initialize error handling middleware.
 
         Args:
@@ -29,58 +39,107 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                 - include_traceback: Whether to include tracebacks in error responses
                 - redact_sensitive_data: Whether to redact sensitive data from error responses
         """
-        super().__init__(app)
+        self.app = app
         self.include_traceback = options.get("include_traceback", False)
         self.redact_sensitive_data = options.get("redact_sensitive_data", True)
 
         logger.info(
-            f"Error handler middleware initialized with include_traceback={self.include_traceback}"
+            "Error handler middleware initialized with include_traceback=%s",
+            self.include_traceback,
         )
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process HTTP requests with error handling.
 
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware or handler
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        await self.call_with_error_handling(scope, receive, send)
 
-        Returns:
-            The response from downstream or an error response
+    async def call_with_error_handling(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Run the downstream app, turning exceptions into JSON error responses.
+
+        Args:
+            scope: ASGI HTTP connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_wrapper)
 
         except Exception as exc:
             # Log the exception
-            logger.error(f"Caught exception in error handler: {exc}", exc_info=True)
-
-            # Convert exception to standardized error response
-            error_dict = http_error_response(exc)
-            status_code = error_dict.pop("status_code", 500)
-
-            # Add traceback if enabled
-            if self.include_traceback:
-                error_dict["traceback"] = traceback.format_exc()
-
-            # Check if the error has special header requirements (like rate limit errors)
-            headers = {}
-            if isinstance(exc, SearchError) and "headers" in exc.details:
-                headers = exc.details["headers"]
-
-            # Special handling for rate limit errors
-            if isinstance(
-                exc, ProviderRateLimitError
-            ) and "retry_after_seconds" in error_dict.get("details", {}):
-                headers["X-RateLimit-Retry-After"] = str(
-                    int(error_dict["details"]["retry_after_seconds"])
-                )
+            logger.error("Caught exception in error handler: %s", exc, exc_info=True)
+
+            # Once headers are out there is no way to send an error response
+            if response_started:
+                raise
 
-            # Log error details
-            logger.error(f"Error in request: {error_dict}")
+            await self._send_error(exc, send)
 
-            # Create consistent JSON response
-            return JSONResponse(
-                status_code=status_code,
-                content=error_dict,
-                headers=headers,
+    async def _send_error(self, exc: Exception, send: Send) -> None:
+        """Send a standardized JSON error response for an exception.
+
+        Args:
+            exc: The exception raised downstream
+            send: ASGI send channel
+        """
+        # Convert exception to standardized error response
+        error_dict = http_error_response(exc)
+        status_code = error_dict.pop("status_code", 500)
+
+        # Add traceback if enabled
+        if self.include_traceback:
+            error_dict["traceback"] = traceback.format_exc()
+
+        # Log error details
+        logger.error("Error in request: %s", error_dict)
+
+        body = render_json(error_dict)
+        headers = [
+            *(
+                self._UNAUTHORIZED_HEADERS
+                if isinstance(exc, AuthenticationError)
+                else self._JSON_HEADERS
+            ),
+            (self._CONTENT_LENGTH, str(len(body)).encode()),
+        ]
+
+        # Check if the error has special header requirements (like rate limit errors)
+        if isinstance(exc, SearchError) and "headers" in exc.details:
+            headers.extend(
+                (name.lower().encode("latin-1"), str(value).encode("latin-1"))
+                for name, value in exc.details["headers"].items()
+            )
+
+        # Special handling for rate limit errors
+        if isinstance(
+            exc, ProviderRateLimitError
+        ) and "retry_after_seconds" in error_dict.get("details", {}):
+            headers.append(
+                (
+                    self._RETRY_AFTER,
+                    str(int(error_dict["details"]["retry_after_seconds"])).encode(),
+                )
             )
+
+        await send(
+            {"type": "http.response.start", "status": status_code, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
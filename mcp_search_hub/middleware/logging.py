@@ -1,23 +1,31 @@
 """Logging middleware for MCP Search Hub."""
 
-import json
+import logging
+import os
 import time
-import uuid
-from collections.abc import Callable
+from urllib.parse import parse_qsl
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from ..utils.logging import get_logger
+from ..utils.logging import TRACE_ID_VAR, get_logger
+from ..utils.serialization import dumps_json
 
 logger = get_logger(__name__)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for centralized request/response logging."""
+def _status_log_level(status_code: int) -> int:
+    """Pick the level a response is logged at from its status code."""
+    if status_code >= 500:
+        return logging.ERROR
+    if status_code >= 400:
+        return logging.WARNING
+    return logging.INFO
 
-    def __init__(self, app, **options):
+
+class LoggingMiddleware:
+    """Pure ASGI middleware for centralized request/response logging."""
+
+    def __init__(self, app: ASGIApp, **options):
         """Initialize logging middleware.
 
         Args:
@@ -29,130 +37,181 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 - sensitive_headers: List of headers to redact
                 - max_body_size: Max body size to log
         """
-        super().__init__(app)
+        self.app = app
         self.log_level = options.get("log_level", "INFO")
         self.include_headers = options.get("include_headers", True)
         self.include_body = options.get("include_body", False)
-        self.sensitive_headers = options.get(
-            "sensitive_headers", ["authorization", "x-api-key", "cookie", "set-cookie"]
+        # Header names are case-insensitive, so normalize the set once here
+        self.sensitive_headers = frozenset(
+            header.lower()
+            for header in options.get(
+                "sensitive_headers",
+                ["authorization", "x-api-key", "cookie", "set-cookie"],
+            )
         )
         self.max_body_size = options.get("max_body_size", 1024)  # 1 KB
+        # Parsing query params is only worth it for debug logging
+        self._parse_query = str(self.log_level).upper() == "DEBUG"
+        # ASGI header names arrive as lowercase bytes, so match them directly
+        self._sensitive_bytes = frozenset(
+            header.encode("latin-1") for header in self.sensitive_headers
+        )
 
         logger.info(
             f"Logging middleware initialized with log level {self.log_level}, "
             f"include_headers={self.include_headers}, include_body={self.include_body}"
         )
 
-    def _redact_sensitive_headers(self, headers: dict[str, str]) -> dict[str, str]:
-        """Redact sensitive headers.
+    def _format_headers(self, raw_headers: list[tuple[bytes, bytes]]) -> dict[str, str]:
+        """Decode raw ASGI headers for logging, redacting sensitive ones.
 
         Args:
-            headers: Headers dictionary
+            raw_headers: ASGI header pairs (names are already lowercase)
 
         Returns:
-            Redacted headers dictionary
+            Headers dictionary with sensitive values redacted
         """
-        redacted = {}
-        for key, value in headers.items():
-            if key.lower() in self.sensitive_headers:
-                redacted[key] = "REDACTED"
-            else:
-                redacted[key] = value
-        return redacted
+        sensitive = self._sensitive_bytes
+        return {
+            name.decode("latin-1"): (
+                "REDACTED" if name in sensitive else value.decode("latin-1")
+            )
+            for name, value in raw_headers
+        }
 
-    def _truncate_body(self, body: str) -> str:
-        """Truncate body if too large.
+    def _format_body(self, raw: bytes, total_size: int) -> str:
+        """Decode a captured body prefix for logging.
 
         Args:
-            body: Request or response body
+            raw: At most ``max_body_size`` leading bytes of the body
+            total_size: Full body size in bytes
 
         Returns:
-            Truncated body
+            Decoded body, marked as truncated if bytes were dropped
         """
-        if len(body) > self.max_body_size:
-            return (
-                body[: self.max_body_size] + f"... [truncated, {len(body)} bytes total]"
-            )
+        try:
+            body = raw.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            if total_size > len(raw) and exc.reason == "unexpected end of data":
+                # A multi-byte character was cut off by the size limit
+                body = raw[: exc.start].decode("utf-8", errors="replace")
+            else:
+                # Genuinely malformed bytes show up as U+FFFD
+                body = raw.decode("utf-8", errors="replace")
+
+        if total_size > self.max_body_size:
+            return body + f"... [truncated, {total_size} bytes total]"
         return body
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process HTTP requests with logging.
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Log HTTP requests and their responses.
 
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware or handler
-
-        Returns:
-            The response from downstream
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Generate a trace ID for this request
-        trace_id = str(uuid.uuid4())
-
-        # Store start time for duration calculation
-        start_time = time.perf_counter()
-
-        # Add trace context to the request
-        request.state.trace_id = trace_id
-        request.state.start_time = start_time
-
-        # Log request
-        log_data = {
-            "trace_id": trace_id,
-            "timestamp": time.time(),
-            "type": "request",
-            "method": request.method,
-            "path": request.url.path,
-            "query": dict(request.query_params),
-            "client_ip": request.client.host if request.client else "unknown",
-        }
-
-        # Add headers if configured
-        if self.include_headers and request.headers:
-            log_data["headers"] = self._redact_sensitive_headers(dict(request.headers))
-
-        # Log the request
-        logger.info(f"HTTP Request: {json.dumps(log_data)}")
-
-        # Call the next middleware/handler
-        response = await call_next(request)
-
-        # Calculate request duration
-        duration_ms = (time.perf_counter() - start_time) * 1000
-
-        # Log response
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Generate a trace ID for this request (same 32 hex chars as uuid4().hex,
+        # without building a UUID object)
+        trace_id = os.urandom(16).hex()
+
+        # Store start time for duration calculation; the wall clock is read
+        # once and response timestamps are derived from the elapsed time
+        start_ns = time.perf_counter_ns()
+        start_wall = time.time()
+
+        # Add trace context to the request state
+        state = scope.setdefault("state", {})
+        state["trace_id"] = trace_id
+        state["start_time"] = start_ns
+
+        method = scope["method"]
+        path = scope["path"]
+
+        # Log request; the record is only built when it will be emitted
+        if logger.isEnabledFor(logging.INFO):
+            client = scope.get("client")
+            log_data = {
+                "trace_id": trace_id,
+                "timestamp": start_wall,
+                "type": "request",
+                "method": method,
+                "path": path,
+                "client_ip": client[0] if client else "unknown",
+            }
+
+            # The raw query string is always logged; parsed params are an
+            # extra field for debug logging only
+            query_string = scope["query_string"].decode("latin-1")
+            if query_string:
+                log_data["query_string"] = query_string
+                if self._parse_query:
+                    log_data["query"] = dict(parse_qsl(query_string))
+
+            # Add headers if configured
+            if self.include_headers and scope["headers"]:
+                log_data["headers"] = self._format_headers(scope["headers"])
+
+            logger.info("HTTP Request: %s", dumps_json(log_data))
+
+        # Capture the response status, headers and (optionally) body as it is sent
         status_code = None
-        if isinstance(response, Response):
-            status_code = response.status_code
+        level = logging.INFO
+        response_headers: list[tuple[bytes, bytes]] = []
+        capture_body = False
+        body_chunks: list[bytes] = []
+        body_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, level, response_headers, capture_body, body_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers = message.get("headers", [])
+                level = _status_log_level(status_code)
+                # Only buffer the body if the response record will be emitted
+                capture_body = self.include_body and logger.isEnabledFor(level)
+            elif capture_body and message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                # Keep only the bytes that will be logged
+                if body_size < self.max_body_size:
+                    body_chunks.append(chunk[: self.max_body_size - body_size])
+                body_size += len(chunk)
+            await send(message)
+
+        # Call the next middleware/handler with the trace ID in context
+        token = TRACE_ID_VAR.set(trace_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            TRACE_ID_VAR.reset(token)
+
+        if not logger.isEnabledFor(level):
+            return
+
+        # Calculate request duration in ms, rounded to 2 places
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        duration_ms = round(elapsed_ns / 1e6, 2)
 
         log_data = {
             "trace_id": trace_id,
-            "timestamp": time.time(),
+            "timestamp": start_wall + elapsed_ns / 1e9,
             "type": "response",
-            "duration_ms": round(duration_ms, 2),
+            "duration_ms": duration_ms,
             "status": status_code,
-            "path": request.url.path,
-            "method": request.method,
+            "path": path,
+            "method": method,
         }
 
         # Add headers if configured
-        if self.include_headers and hasattr(response, "headers"):
-            log_data["headers"] = self._redact_sensitive_headers(dict(response.headers))
-
-        # Log response body if configured and possible
-        if self.include_body and hasattr(response, "body"):
-            try:
-                body = response.body.decode("utf-8")
-                log_data["body"] = self._truncate_body(body)
-            except Exception:
-                log_data["body"] = "[binary or non-utf8 content]"
-
-        # Log the response
-        log_msg = f"HTTP Response: {json.dumps(log_data)}"
-        if status_code and status_code >= 500:
-            logger.error(log_msg)
-        elif status_code and status_code >= 400:
-            logger.warning(log_msg)
-        else:
-            logger.info(log_msg)
-
-        return response
+        if self.include_headers:
+            log_data["headers"] = self._format_headers(response_headers)
+
+        # Log response body if configured
+        if body_chunks:
+            log_data["body"] = self._format_body(b"".join(body_chunks), body_size)
+
+        logger.log(level, "HTTP Response: %s", dumps_json(log_data))
@@ -0,0 +1,59 @@
+"""Request path matching shared by middleware with skip-path options."""
+
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+
+def compile_skip_pattern(paths: Iterable[str]) -> re.Pattern | None:
+    """Compile skip paths into one regex matching each path and anything below it.
+
+    Matching respects segment boundaries, so ``/docs`` covers ``/docs/x`` but
+    not ``/docsearch``.
+
+    Args:
+        paths: Paths to skip
+
+    Returns:
+        Compiled pattern, or None if there are no paths
+    """
+    prefixes = sorted({path.rstrip("/") for path in paths}, key=len, reverse=True)
+    if not prefixes:
+        return None
+    alternatives = "|".join(re.escape(prefix) for prefix in prefixes)
+    return re.compile(rf"(?:{alternatives})(?:/|$)")
+
+
+class SkipPathMatcher:
+    """Check whether a request path is, or lies below, one of the skipped paths.
+
+    Exact paths hit a set lookup; anything below a skip path is matched by a
+    single compiled regex. Request paths repeat heavily, so the regex result
+    is memoized per path.
+    """
+
+    def __init__(self, paths: Iterable[str], cache_size: int = 1024):
+        """Initialize the matcher.
+
+        Args:
+            paths: Paths to skip
+            cache_size: Number of per-path decisions to memoize
+        """
+        paths = list(paths)
+        self._exact = frozenset(paths)
+        self._pattern = compile_skip_pattern(paths)
+        self._match_below = lru_cache(maxsize=cache_size)(self._match)
+
+    def __call__(self, path: str) -> bool:
+        """Check whether a request path should be skipped.
+
+        Args:
+            path: Request path
+
+        Returns:
+            True if the path is, or lies below, a skipped path
+        """
+        return path in self._exact or self._match_below(path)
+
+    def _match(self, path: str) -> bool:
+        return self._pattern is not None and bool(self._pattern.match(path))
@@ -1,8 +1,7 @@
 """Rate limiting middleware for MCP Search Hub."""
 
-import asyncio
 import time
-from collections import defaultdict
+from collections import OrderedDict
 from collections.abc import Callable
 
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -11,12 +10,21 @@ from starlette.responses import Response
 
 from ..utils.errors import ProviderRateLimitError
 from ..utils.logging import get_logger
+from .paths import SkipPathMatcher
 
 logger = get_logger(__name__)
 
 
 class RateLimiter:
-    """Implements a sliding window rate limiter."""
+    """Implements a token bucket rate limiter.
+
+    The bucket holds up to ``limit`` tokens and refills continuously at
+    ``limit / window`` tokens per second, so state is two floats per limiter
+    regardless of traffic. One limiter is kept per client, so instances are
+    slotted to drop the per-object ``__dict__``.
+    """
+
+    __slots__ = ("last", "limit", "rate", "tokens", "window")
 
     def __init__(self, limit: int, window: int):
         """Initialize rate limiter.
@@ -27,36 +35,41 @@ class RateLimiter:
         """
         self.limit = limit
         self.window = window
-        self.requests = []
-        self._lock = asyncio.Lock()
+        self.rate = limit / window
+        self.tokens = float(limit)
+        self.last = time.monotonic()
 
-    async def check_rate_limit(self, identifier: str) -> tuple[bool, int, float]:
+    def check_rate_limit(self, identifier: str) -> tuple[bool, int, float]:
         """Check if a request exceeds the rate limit.
 
+        This is synchronous on purpose: the check never awaits, so on a single
+        event loop the read-modify-write cannot interleave and needs no lock.
+
         Args:
             identifier: Client identifier (IP, API key, etc.)
 
         Returns:
             Tuple of (allowed, remaining_requests, reset_time)
         """
-        async with self._lock:
-            # Current time
-            now = time.time()
+        # Monotonic time so wall-clock jumps cannot drain or overfill the bucket
+        now = time.monotonic()
+        self._refill(now)
 
-            # Filter out old requests
-            self.requests = [r for r in self.requests if r > now - self.window]
+        # Check if we're over the limit
+        if self.tokens < 1:
+            # Time until one whole token has refilled
+            return False, 0, (1 - self.tokens) / self.rate
 
-            # Check if we're over the limit
-            if len(self.requests) >= self.limit:
-                # Calculate time until the oldest request expires
-                reset_time = self.window - (now - self.requests[0])
-                return False, 0, reset_time
+        # Take a token for the current request
+        self.tokens -= 1
 
-            # Add current request
-            self.requests.append(now)
+        # Return allowed with remaining requests
+        return True, int(self.tokens), self.window
 
-            # Return allowed with remaining requests
-            return True, self.limit - len(self.requests), self.window
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill, up to the bucket size."""
+        self.tokens = min(self.limit, self.tokens + (now - self.last) * self.rate)
+        self.last = now
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
@@ -73,25 +86,66 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 - global_limit: Global requests per window
                 - global_window: Global time window in seconds
                 - skip_paths: List of paths to skip rate limiting
+                - max_clients: Maximum number of per-client limiters to keep
         """
         super().__init__(app)
         self.limit = options.get("limit", 100)
         self.window = options.get("window", 60)  # Default: 100 requests per minute
         self.skip_paths = options.get("skip_paths", ["/health", "/metrics"])
+        # Skipping respects segment boundaries, so /healthz is still limited
+        self._is_skipped = SkipPathMatcher(self.skip_paths)
+
+        self.max_clients = options.get("max_clients", 10_000)
 
-        # Create a rate limiter for each unique client
-        self.limiters = defaultdict(lambda: RateLimiter(self.limit, self.window))
+        # Per-client rate limiters, least recently used first
+        self.limiters: OrderedDict[str, RateLimiter] = OrderedDict()
 
         # Overall rate limit for the server
         self.global_limiter = RateLimiter(
             options.get("global_limit", 1000), options.get("global_window", 60)
         )
 
+        # Limits are fixed, so their header values are built once
+        self._limit_str = str(self.limit)
+        self._global_limit_str = str(self.global_limiter.limit)
+
         logger.info(
-            f"Rate limiting middleware initialized: {self.limit} requests per {self.window}s "
-            f"per client, {len(self.skip_paths)} skipped paths"
+            "Rate limiting middleware initialized: %d requests per %ss per client, "
+            "%d skipped paths",
+            self.limit,
+            self.window,
+            len(self.skip_paths),
         )
 
+    def _get_limiter(self, client_id: str) -> RateLimiter:
+        """Get the rate limiter for a client, evicting idle or excess limiters.
+
+        A bucket left idle for a whole window has refilled completely, so
+        dropping it is indistinguishable from keeping it.
+
+        Args:
+            client_id: Client identifier
+
+        Returns:
+            The client's rate limiter
+        """
+        limiters = self.limiters
+        limiter = limiters.get(client_id)
+        if limiter is not None:
+            limiters.move_to_end(client_id)
+            return limiter
+
+        # Evict from the least recently used end
+        idle_before = time.monotonic() - self.window
+        while limiters:
+            oldest = next(iter(limiters.values()))
+            if len(limiters) < self.max_clients and oldest.last > idle_before:
+                break
+            limiters.popitem(last=False)
+
+        limiter = limiters[client_id] = RateLimiter(self.limit, self.window)
+        return limiter
+
     def _get_client_id(self, request: Request) -> str:
         """Extract client identifier from request.
 
@@ -132,11 +186,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             ProviderRateLimitError: If rate limit exceeded
         """
         # Skip rate limiting for allowed paths
-        if any(request.url.path.startswith(path) for path in self.skip_paths):
+        if self._is_skipped(request.url.path):
             return await call_next(request)
 
         # Check global rate limit first
-        allowed, remaining, reset = await self.global_limiter.check_rate_limit("global")
+        allowed, remaining, reset = self.global_limiter.check_rate_limit("global")
         if not allowed:
             logger.warning("Global rate limit exceeded")
 
@@ -151,7 +205,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
             # Store headers in error details for response processing
             error.details["headers"] = {
-                "X-RateLimit-Limit": str(self.global_limiter.limit),
+                "X-RateLimit-Limit": self._global_limit_str,
                 "X-RateLimit-Remaining": "0",
                 "X-RateLimit-Reset": str(int(reset)),
                 "Retry-After": str(int(reset)),
@@ -161,12 +215,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         # Check client-specific rate limit
         client_id = self._get_client_id(request)
-        allowed, remaining, reset = await self.limiters[client_id].check_rate_limit(
-            client_id
-        )
+        limiter = self._get_limiter(client_id)
+        allowed, remaining, reset = limiter.check_rate_limit(client_id)
 
         if not allowed:
-            logger.warning(f"Rate limit exceeded for client {client_id}")
+            logger.warning("Rate limit exceeded for client %s", client_id)
 
             # Use ProviderRateLimitError from the error hierarchy for consistency
             # This integrates with the retry middleware and error handling pipeline
@@ -180,7 +233,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             # Store client ID and headers in error details for response processing
             error.details["client_id"] = client_id
             error.details["headers"] = {
-                "X-RateLimit-Limit": str(self.limiters[client_id].limit),
+                "X-RateLimit-Limit": self._limit_str,
                 "X-RateLimit-Remaining": "0",
                 "X-RateLimit-Reset": str(int(reset)),
                 "Retry-After": str(int(reset)),
@@ -191,18 +244,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Call the next middleware/handler
         response = await call_next(request)
 
-        # Add rate limit headers to the response
+        # Add rate limit headers to the response, reusing the values from the
+        # check above rather than reading the limiter's state again
         if hasattr(response, "headers"):
-            # Add rate limit headers
-            limiter = self.limiters[client_id]
-
-            # Just check current state without incrementing
-            remaining = max(0, limiter.limit - len(limiter.requests))
-
-            response.headers["X-RateLimit-Limit"] = str(limiter.limit)
+            response.headers["X-RateLimit-Limit"] = self._limit_str
             response.headers["X-RateLimit-Remaining"] = str(remaining)
-            response.headers["X-RateLimit-Reset"] = str(
-                int(time.time() + limiter.window)
-            )
+            response.headers["X-RateLimit-Reset"] = str(int(time.time() + reset))
 
         return response
@@ -8,36 +8,15 @@ import asyncio
 import random
 from collections.abc import Callable
 
-import httpx
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
-from ..utils.errors import ProviderTimeoutError, SearchError
 from ..utils.logging import get_logger
+from ..utils.retry import is_retryable_exception
 
 logger = get_logger(__name__)
 
-# Retryable HTTP status codes
-RETRYABLE_STATUS_CODES: set[int] = {
-    408,  # Request Timeout
-    429,  # Too Many Requests
-    500,  # Internal Server Error
-    502,  # Bad Gateway
-    503,  # Service Unavailable
-    504,  # Gateway Timeout
-}
-
-# Retryable exception types
-RETRYABLE_EXCEPTIONS: tuple[type[Exception], ...] = (
-    httpx.TimeoutException,
-    httpx.ConnectError,
-    httpx.RemoteProtocolError,
-    ConnectionError,
-    TimeoutError,
-    ProviderTimeoutError,
-)
-
 
 class RetryMiddleware(BaseHTTPMiddleware):
     """Middleware for applying exponential backoff retry logic."""
@@ -64,8 +43,11 @@ class RetryMiddleware(BaseHTTPMiddleware):
         self.skip_paths = options.get("skip_paths", ["/health", "/metrics"])
 
         logger.info(
-            f"Retry middleware initialized with max_retries={self.max_retries}, "
-            f"base_delay={self.base_delay}s, max_delay={self.max_delay}s"
+            "Retry middleware initialized with max_retries=%d, base_delay=%ss, "
+            "max_delay=%ss",
+            self.max_retries,
+            self.base_delay,
+            self.max_delay,
         )
 
     def calculate_delay(self, attempt: int) -> float:
@@ -96,20 +78,8 @@ class RetryMiddleware(BaseHTTPMiddleware):
         Returns:
             True if exception is retryable, False otherwise
         """
-        # Check if it's a known retryable exception type
-        if isinstance(exc, RETRYABLE_EXCEPTIONS):
-            return True
-
-        # Check if it's an HTTP status code exception
-        if isinstance(exc, httpx.HTTPStatusError):
-            return exc.response.status_code in RETRYABLE_STATUS_CODES
-
-        # Check if it's a search error that might be retryable
-        if isinstance(exc, SearchError):
-            # Only retry if it's a temporary error
-            return "temporary" in str(exc).lower() or "timeout" in str(exc).lower()
-
-        return False
+        # Share one classification with the provider retry helpers
+        return is_retryable_exception(exc)
 
     def should_retry_request(self, request: Request) -> bool:
         """Determine if a request should be retried.
@@ -158,24 +128,30 @@ class RetryMiddleware(BaseHTTPMiddleware):
                 # Check if this is the last attempt
                 if attempt >= self.max_retries:
                     logger.error(
-                        f"All retry attempts exhausted ({attempt}/{self.max_retries}): {exc}"
+                        "All retry attempts exhausted (%d/%d): %s",
+                        attempt,
+                        self.max_retries,
+                        exc,
                     )
                     raise
 
                 # Check if the exception is retryable
                 if not self.is_retryable_exception(exc):
-                    logger.debug(f"Non-retryable exception: {exc}")
+                    logger.debug("Non-retryable exception: %s", exc)
                     raise
 
                 # Calculate delay for next attempt
                 delay = self.calculate_delay(attempt)
 
-                # Get request info for logging
-                request_info = f"{request.method} {request.url.path}"
-
                 logger.warning(
-                    f"Retryable error for {request_info} (attempt {attempt + 1}/{self.max_retries + 1}): {exc}. "
-                    f"Retrying after {delay:.2f}s..."
+                    "Retryable error for %s %s (attempt %d/%d): %s. "
+                    "Retrying after %.2fs...",
+                    request.method,
+                    request.url.path,
+                    attempt + 1,
+                    self.max_retries + 1,
+                    exc,
+                    delay,
                 )
 
                 # Wait before retrying
@@ -7,9 +7,9 @@ to reduce code duplication and standardize provider behavior.
 import asyncio
 import logging
 import os
+import secrets
 import subprocess
 import sys
-import uuid
 from collections.abc import Callable
 from decimal import Decimal
 from enum import Enum
@@ -32,6 +32,7 @@ from ..utils.errors import (
     ProviderRateLimitError,
     ProviderServiceError,
     ProviderTimeoutError,
+    QueryBudgetExceededError,
 )
 from ..utils.retry import RetryConfig, with_exponential_backoff
 from .base import SearchProvider
@@ -403,7 +404,7 @@ class BaseMCPProvider(SearchProvider):
             )
 
         # Generate a unique request ID for tracking
-        request_id = str(uuid.uuid4())
+        request_id = secrets.token_hex(16)
 
         # Check rate limits
         rate_limited = not await self.rate_limiter.wait_if_limited(request_id)
@@ -424,8 +425,6 @@ class BaseMCPProvider(SearchProvider):
             # Release the rate limit token
             await self.rate_limiter.release(request_id)
 
-            from ..utils.errors import QueryBudgetExceededError
-
             raise QueryBudgetExceededError(
                 query=query.query,
                 budget=float(query.budget),
@@ -1,5 +1,6 @@
 """Generic MCP provider implementation using configuration."""
 
+import json
 import logging
 from decimal import Decimal
 from typing import Any
@@ -119,8 +120,6 @@ class GenericMCPProvider(BaseMCPProvider):
                         if isinstance(text_data, str):
                             # Try to parse as JSON first
                             try:
-                                import json
-
                                 json_data = json.loads(text_data)
                                 if (
                                     isinstance(json_data, dict)
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -17,6 +18,7 @@ from ..config.settings import AppSettings
 from ..models.query import SearchQuery
 from ..models.results import SearchResponse
 from ..providers.base import SearchProvider
+from .analyzer import QueryAnalyzer
 from .complexity_classifier import ComplexityClassifier
 from .llm_router import LLMQueryRouter
 from .pattern_router import PatternRouter
@@ -92,8 +94,6 @@ class HybridRouter:
         Returns:
             RoutingDecision with selected providers and strategy
         """
-        import time
-
         start_time = time.time()
 
         # Classify query complexity
@@ -288,8 +288,6 @@ class HybridRouter:
             List of selected provider names
         """
         # Get features for LLM routing
-        from ..query_routing.analyzer import QueryAnalyzer
-
         analyzer = QueryAnalyzer()
         features = analyzer.extract_features(query)
 
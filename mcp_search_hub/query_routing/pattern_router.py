@@ -231,8 +231,6 @@ class PatternRouter:
             PatternScore for the provider
         """
         # Create a synthetic query for the content detector
-        from ..models.query import SearchQuery
-
         query = SearchQuery(query=features.get("query", ""))
 
         # Route and find this provider's score
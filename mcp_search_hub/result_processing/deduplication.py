@@ -2,11 +2,13 @@
 
 import re
 import time
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 from rapidfuzz import fuzz
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.metrics.pairwise import linear_kernel
 from w3lib.url import canonicalize_url
 
 from ..models.base import HealthStatus
@@ -210,7 +212,8 @@ def remove_duplicates(
         return []
 
     # Step 1: Normalize URLs and group exact duplicates
-    normalized_urls = {}
+    # Maps normalized URL -> position of its result in unique_results
+    normalized_urls: dict[str, int] = {}
     unique_results = []
 
     for result in results:
@@ -218,18 +221,17 @@ def remove_duplicates(
 
         if normalized_url in normalized_urls:
             # Handle exact URL duplicates - keep the highest score
-            existing_result = normalized_urls[normalized_url]
+            idx = normalized_urls[normalized_url]
+            existing_result = unique_results[idx]
             if result.score > existing_result.score:
                 # Merge metadata before replacing
                 _merge_metadata(result, existing_result)
-                idx = unique_results.index(existing_result)
                 unique_results[idx] = result
-                normalized_urls[normalized_url] = result
             else:
                 # If keeping existing result, merge metadata
                 _merge_metadata(existing_result, result)
         else:
-            normalized_urls[normalized_url] = result
+            normalized_urls[normalized_url] = len(unique_results)
             unique_results.append(result)
 
     # Step 2: Apply fuzzy URL matching if needed
@@ -244,8 +246,13 @@ def remove_duplicates(
     return unique_results
 
 
+@lru_cache(maxsize=4096)
 def _normalize_url(url: str) -> str:
-    """Normalize URL for comparison."""
+    """Normalize URL for comparison.
+
+    Results are memoized since the same URLs recur across providers and
+    are normalized again during fuzzy matching.
+    """
     # Basic normalization with w3lib
     normalized = canonicalize_url(
         url,
@@ -318,6 +325,9 @@ def _apply_fuzzy_matching(
     # Sort by score to prioritize higher-scored results
     sorted_results = sorted(results, key=lambda x: x.score, reverse=True)
 
+    # Normalize each URL once rather than once per pairwise comparison
+    norm_urls = [_normalize_url(r.url) for r in sorted_results]
+
     # Keep track of which results to include in the final set
     keep_indices = {0}  # Always keep the highest-scored result
 
@@ -325,12 +335,12 @@ def _apply_fuzzy_matching(
     for i in range(1, len(sorted_results)):
         is_duplicate = False
         result = sorted_results[i]
-        norm_url_i = _normalize_url(result.url)
+        norm_url_i = norm_urls[i]
 
         # Compare against all kept results so far
         for j in keep_indices:
             kept_result = sorted_results[j]
-            norm_url_j = _normalize_url(kept_result.url)
+            norm_url_j = norm_urls[j]
 
             # Skip exact matches (handled earlier)
             if norm_url_i == norm_url_j:
@@ -359,27 +369,33 @@ def _apply_fuzzy_matching(
         contents = [f"{r.title} {r.snippet}" for r in kept_results]
 
         try:
-            # Generate TF-IDF vectors
-            vectorizer = TfidfVectorizer(lowercase=True, stop_words="english")
+            # Generate L2-normalized TF-IDF vectors; since rows already have
+            # unit norm, cosine similarity reduces to a plain dot product
+            vectorizer = TfidfVectorizer(
+                lowercase=True, stop_words="english", norm="l2"
+            )
             tfidf_matrix = vectorizer.fit_transform(contents)
-            similarity_matrix = cosine_similarity(tfidf_matrix)
+            similarity_matrix = linear_kernel(tfidf_matrix)
 
-            # Find content duplicates
-            final_indices = {0}  # Always keep highest scored
+            # Find content duplicates, comparing each result against all kept
+            # results with a single row slice instead of a per-pair loop
+            final_indices = [0]  # Always keep highest scored
             for i in range(1, len(kept_results)):
-                content_duplicate = False
-
-                for j in final_indices:
-                    similarity = similarity_matrix[i, j]
-                    kept_results[i].metadata["content_similarity_score"] = similarity
-
-                    if similarity >= content_threshold:
-                        content_duplicate = True
-                        _merge_metadata(kept_results[j], kept_results[i])
-                        break
-
-                if not content_duplicate:
-                    final_indices.add(i)
+                similarities = similarity_matrix[i, final_indices]
+                matches = np.flatnonzero(similarities >= content_threshold)
+
+                if matches.size:
+                    # Duplicate of the first kept result above the threshold
+                    first_match = matches[0]
+                    similarity = similarities[first_match]
+                    _merge_metadata(
+                        kept_results[final_indices[first_match]], kept_results[i]
+                    )
+                else:
+                    similarity = similarities[-1]
+                    final_indices.append(i)
+
+                kept_results[i].metadata["content_similarity_score"] = similarity
 
             return [kept_results[i] for i in final_indices]
         except Exception as e:
@@ -2,6 +2,7 @@
 
 import datetime
 import time
+from types import MappingProxyType
 from typing import Any
 
 from ..config.settings import MergerSettings
@@ -18,14 +19,16 @@ logger = get_logger(__name__)
 class ResultMerger(ResultMergerBase[MergerSettings]):
     """Merges and ranks results from multiple providers."""
 
-    # Provider quality weights for ranking
-    DEFAULT_WEIGHTS = {
-        "linkup": 1.0,  # Excellent for real-time and factual accuracy
-        "exa": 0.95,  # Strong academic and research focus
-        "perplexity": 0.9,  # Good for comprehensive searches
-        "tavily": 0.85,  # Good general search with relevance scoring
-        "firecrawl": 0.8,  # Specialized for content extraction
-    }
+    # Provider quality weights for ranking (read-only, shared by all instances)
+    DEFAULT_WEIGHTS = MappingProxyType(
+        {
+            "linkup": 1.0,  # Excellent for real-time and factual accuracy
+            "exa": 0.95,  # Strong academic and research focus
+            "perplexity": 0.9,  # Good for comprehensive searches
+            "tavily": 0.85,  # Good general search with relevance scoring
+            "firecrawl": 0.8,  # Specialized for content extraction
+        }
+    )
 
     # Credibility tiers for domains (high-quality domains get a boost)
     CREDIBILITY_TIERS = {
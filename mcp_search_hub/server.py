@@ -5,8 +5,8 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import secrets
 import time
-import uuid
 from typing import Any
 
 from fastmcp import Context, FastMCP
@@ -17,6 +17,7 @@ from starlette.responses import JSONResponse
 from .config import get_settings
 from .middleware import (
     AuthMiddleware,
+    CombinedAuthErrorMiddleware,
     ErrorHandlerMiddleware,
     LoggingMiddleware,
     RateLimitMiddleware,
@@ -136,7 +137,12 @@ class SearchServer:
             )
             logger.info("Rate limit middleware initialized")
 
-        if middleware_config.auth_enabled:
+        combine_auth = (
+            middleware_config.auth_enabled
+            and middleware_config.auth_combine_with_error_handler
+        )
+
+        if middleware_config.auth_enabled and not combine_auth:
             app.add_middleware(
                 AuthMiddleware,
                 api_keys=middleware_config.auth_api_keys,
@@ -155,13 +161,25 @@ class SearchServer:
             )
             logger.info("Logging middleware initialized")
 
-        # Error handler is always enabled
-        app.add_middleware(
-            ErrorHandlerMiddleware,
-            include_traceback=self.settings.environment == "development",
-            redact_sensitive_data=True,
-        )
-        logger.info("Error handler middleware initialized")
+        # Error handler is always enabled, fused with auth when configured
+        if combine_auth:
+            app.add_middleware(
+                CombinedAuthErrorMiddleware,
+                api_keys=middleware_config.auth_api_keys,
+                skip_auth_paths=middleware_config.auth_skip_paths,
+                include_traceback=self.settings.environment == "development",
+                redact_sensitive_data=True,
+            )
+            logger.info(
+                "Combined authentication and error handler middleware initialized"
+            )
+        else:
+            app.add_middleware(
+                ErrorHandlerMiddleware,
+                include_traceback=self.settings.environment == "development",
+                redact_sensitive_data=True,
+            )
+            logger.info("Error handler middleware initialized")
 
     def _initialize_providers(self) -> dict[str, SearchProvider]:
         """Initialize providers with direct imports."""
@@ -218,7 +236,7 @@ class SearchServer:
             advanced: dict[str, Any] | None = None,
         ) -> SearchResponse:
             """Execute a search query across multiple providers."""
-            request_id = str(uuid.uuid4())
+            request_id = secrets.token_hex(16)
             ctx.info(f"Processing search request {request_id}: {query}")
 
             # Build search query object
@@ -281,7 +299,7 @@ class SearchServer:
                         )
                         async def provider_tool_wrapper(ctx: Context, **kwargs):
                             """Wrapper function for provider-specific tools."""
-                            request_id = str(uuid.uuid4())
+                            request_id = secrets.token_hex(16)
                             ctx.info(
                                 f"Invoking {prov_name} tool {orig_tool_name} with request {request_id}"
                             )
@@ -342,7 +360,7 @@ class SearchServer:
                         status_code=422,
                     )
 
-                request_id = str(uuid.uuid4())
+                request_id = secrets.token_hex(16)
 
                 # Create a simple context for logging
                 class SimpleContext:
@@ -12,6 +12,9 @@ from typing import Any, TypeVar
 # Type variable for self-referential return types
 T = TypeVar("T", bound="SearchError")
 
+# Challenge sent with 401 responses, as a raw ASGI header pair
+WWW_AUTHENTICATE_HEADER = (b"www-authenticate", b'Bearer realm="mcp-search-hub"')
+
 
 class SearchError(Exception):
     """Base class for all search-related exceptions in the application.
@@ -20,6 +23,10 @@ class SearchError(Exception):
     error handling throughout the application.
     """
 
+    # Whether errors of this class are temporary and worth retrying; None
+    # leaves the decision to the retry logic's message check
+    transient: bool | None = None
+
     def __init__(
         self,
         message: str,
@@ -27,6 +34,8 @@ class SearchError(Exception):
         status_code: int = http.HTTPStatus.INTERNAL_SERVER_ERROR,
         original_error: Exception | None = None,
         details: dict[str, Any] | None = None,
+        *,
+        transient: bool | None = None,
     ):
         """Initialize the error with context information.
 
@@ -36,12 +45,16 @@ class SearchError(Exception):
             status_code: HTTP status code to use when converting to HTTP responses
             original_error: The original exception that caused this error, if any
             details: Additional structured details about the error
+            transient: Whether this error is temporary and worth retrying;
+                None keeps the class default
         """
         self.message = message
         self.provider = provider
         self.status_code = status_code
         self.original_error = original_error
         self.details = details or {}
+        if transient is not None:
+            self.transient = transient
         super().__init__(message)
 
     @classmethod
@@ -173,6 +186,8 @@ class ProviderInitializationError(ProviderError):
 class ProviderTimeoutError(ProviderError):
     """Error raised when a provider operation times out."""
 
+    transient = True
+
     def __init__(
         self,
         provider: str,
@@ -213,6 +228,8 @@ class ProviderTimeoutError(ProviderError):
 class ProviderRateLimitError(ProviderError):
     """Error raised when a provider's rate limit is exceeded."""
 
+    transient = True
+
     def __init__(
         self,
         provider: str,
@@ -703,6 +720,8 @@ class NetworkError(SearchError):
 class NetworkConnectionError(NetworkError):
     """Error raised when a connection cannot be established."""
 
+    transient = True
+
     def __init__(self, message: str | None = None, url: str | None = None, **kwargs):
         """Initialize a connection error.
 
@@ -722,6 +741,8 @@ class NetworkConnectionError(NetworkError):
 class NetworkTimeoutError(NetworkError):
     """Error raised when a network operation times out."""
 
+    transient = True
+
     def __init__(
         self,
         message: str | None = None,
@@ -1,9 +1,32 @@
 """Logging configuration."""
 
+import atexit
 import logging
+import queue
 import sys
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+# Background listener that writes queued records; see configure_logging()
+_queue_listener: QueueListener | None = None
+
+# Trace ID of the HTTP request being handled, set by LoggingMiddleware and
+# readable anywhere below it (including across awaits)
+TRACE_ID_VAR: ContextVar[str | None] = ContextVar("trace_id", default=None)
+
+
+class TraceIdFilter(logging.Filter):
+    """Stamp log records with the trace ID of the current request.
+
+    Records logged outside a request get ``"-"``.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Add ``trace_id`` to the record; never drops it."""
+        record.trace_id = TRACE_ID_VAR.get() or "-"
+        return True
+
 
 def get_logger(name: str | None = None) -> logging.Logger:
     """Get a logger instance.
@@ -44,17 +67,53 @@ def configure_logging(log_level: str = "INFO") -> logging.Logger:
 
     # Configure formatter
     formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        "%(asctime)s - %(name)s - %(levelname)s - [%(trace_id)s] %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     handler.setFormatter(formatter)
 
-    # Add handler to logger
-    logger.addHandler(handler)
+    # Logging calls only enqueue records and the formatter plus the write to
+    # stdout run on the listener's background thread. QueueHandler.prepare()
+    # still merges message args and renders tracebacks on the calling thread.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(numeric_level)
+    # Context variables are only visible on the calling thread, so the trace
+    # ID is stamped here rather than by the listener
+    queue_handler.addFilter(TraceIdFilter())
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+
+    # Attach the new queue handler before detaching any previous one so no
+    # record goes unhandled, then retire the old listener once nothing can
+    # enqueue to it; stopping it drains whatever is left in its queue
+    logger.addHandler(queue_handler)
+    for existing in list(logger.handlers):
+        if isinstance(existing, QueueHandler) and existing is not queue_handler:
+            logger.removeHandler(existing)
+    _replace_queue_listener(listener)
 
     return logger
 
 
+def _replace_queue_listener(listener: QueueListener) -> None:
+    """Track a started queue listener, stopping and draining any previous one."""
+    global _queue_listener  # noqa: PLW0603
+    if _queue_listener is None:
+        atexit.register(_stop_queue_listener)
+    else:
+        _queue_listener.stop()
+    _queue_listener = listener
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued log records and stop the background listener."""
+    global _queue_listener  # noqa: PLW0603
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def log_query(
     logger: logging.Logger,
     query: dict[str, Any],
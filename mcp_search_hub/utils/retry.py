@@ -48,6 +48,15 @@ RETRYABLE_EXCEPTIONS: tuple[type[Exception], ...] = (
     NetworkTimeoutError,
 )
 
+# Message keywords marking a SearchError without an explicit flag as temporary
+TRANSIENT_ERROR_KEYWORDS: tuple[str, ...] = (
+    "temporary",
+    "timeout",
+    "retry",
+    "overloaded",
+    "busy",
+)
+
 
 class RetryConfig:
     """Configuration for exponential backoff retry."""
@@ -104,6 +113,11 @@ def is_retryable_exception(exc: Exception) -> bool:
     Returns:
         True if exception is retryable, False otherwise
     """
+    # An explicit flag, set at raise time or by the error class, wins over
+    # any inspection of the exception
+    if isinstance(exc, SearchError) and exc.transient is not None:
+        return exc.transient
+
     # Check if it's a known retryable exception type
     if isinstance(exc, RETRYABLE_EXCEPTIONS):
         return True
@@ -112,37 +126,17 @@ def is_retryable_exception(exc: Exception) -> bool:
     if isinstance(exc, httpx.HTTPStatusError):
         return exc.response.status_code in RETRYABLE_STATUS_CODES
 
-    # Check for specific provider error types that are retryable
-    if isinstance(exc, ProviderTimeoutError):
-        return True
-
-    # Rate limits are retryable
-    if isinstance(exc, ProviderRateLimitError):
-        return True
-
-    # Network errors are generally retryable
-    if isinstance(exc, NetworkConnectionError | NetworkTimeoutError):
-        return True
-
-    # Service errors can be retryable if they're temporary
-    if isinstance(exc, ProviderServiceError):
-        # Check the status code if available
-        if hasattr(exc, "status_code") and exc.status_code in RETRYABLE_STATUS_CODES:
-            return True
-        # Check for temporary indicators in message
-        if any(
-            keyword in str(exc).lower()
-            for keyword in ["temporary", "timeout", "retry", "overloaded", "busy"]
+    if isinstance(exc, SearchError):
+        # Service errors with a retryable status code are temporary
+        if (
+            isinstance(exc, ProviderServiceError)
+            and exc.status_code in RETRYABLE_STATUS_CODES
         ):
             return True
 
-    # For general SearchErrors, be more cautious
-    if isinstance(exc, SearchError):
-        # Only retry if it's a temporary error
-        return any(
-            keyword in str(exc).lower()
-            for keyword in ["temporary", "timeout", "retry", "overloaded", "busy"]
-        )
+        # Otherwise only retry if the message marks it as temporary
+        message = str(exc).lower()
+        return any(keyword in message for keyword in TRANSIENT_ERROR_KEYWORDS)
 
     return False
 
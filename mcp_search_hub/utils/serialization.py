@@ -0,0 +1,46 @@
+"""JSON encoding for middleware hot paths.
+
+orjson is used when it is installed (``pip install mcp-search-hub[perf]``);
+otherwise the standard library encoder produces equivalent compact output.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def render_json(data: Any) -> bytes:
+    """Encode data as compact UTF-8 JSON bytes.
+
+    Values JSON cannot represent natively are converted with ``str``.
+
+    Args:
+        data: Data to encode
+
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        data, ensure_ascii=False, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+def dumps_json(data: Any) -> str:
+    """Encode data as a compact JSON string, e.g. for log messages.
+
+    Args:
+        data: Data to encode
+
+    Returns:
+        Encoded JSON document
+    """
+    return render_json(data).decode("utf-8")
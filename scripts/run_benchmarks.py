@@ -64,7 +64,7 @@ async def benchmark_parallel_strategy(provider_counts=None, result_counts=None):
         strategy = ParallelExecutionStrategy()
 
         # Run benchmark
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         results = await strategy.execute(
             query=query,
             features=features,
@@ -72,7 +72,7 @@ async def benchmark_parallel_strategy(provider_counts=None, result_counts=None):
             selected_providers=list(providers.keys()),
             timeout_config=timeout_config,
         )
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
 
         # Print results
         print(f"  Execution time: {execution_time:.3f}s")
@@ -135,7 +135,7 @@ async def benchmark_cascade_strategy(provider_counts=None, fail_rates=None):
             strategy = CascadeExecutionStrategy()
 
             # Run benchmark
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             results = await strategy.execute(
                 query=query,
                 features=features,
@@ -143,7 +143,7 @@ async def benchmark_cascade_strategy(provider_counts=None, fail_rates=None):
                 selected_providers=list(providers.keys()),
                 timeout_config=timeout_config,
             )
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             # Print results
             print(f"  Execution time: {execution_time:.3f}s")
@@ -212,9 +212,9 @@ async def benchmark_result_merger(result_counts=None):
             )
 
         # Run benchmark
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         merged_results = merger.merge_results(provider_results)
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
 
         # Print results
         print(f"  Execution time: {execution_time:.3f}s")
@@ -260,7 +260,7 @@ async def benchmark_throughput(concurrent_queries=None):
 
         # Create tasks
         tasks = []
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         for i in range(concurrency):
             query = SearchQuery(query=f"throughput benchmark query {i}")
@@ -289,7 +289,7 @@ async def benchmark_throughput(concurrent_queries=None):
         merged_results = await asyncio.gather(*merger_tasks)
 
         # Calculate metrics
-        total_time = time.time() - start_time
+        total_time = (time.perf_counter_ns() - start_ns) / 1e9
 
         # Print results
         print(f"  Total execution time: {total_time:.3f}s")
@@ -2,7 +2,7 @@
 
 import pytest
 
-from mcp_search_hub.config import get_settings
+from mcp_search_hub.config import reset_settings_cache
 
 
 @pytest.fixture
@@ -16,10 +16,10 @@ def mock_env(monkeypatch):
     monkeypatch.setenv("LOG_LEVEL", "DEBUG")
     monkeypatch.setenv("CACHE_TTL", "1800")
 
-    # Clear lru_cache to ensure it picks up the new env vars
-    get_settings.cache_clear()
+    # Clear cached settings to ensure they pick up the new env vars
+    reset_settings_cache()
 
     yield
 
     # Clean up
-    get_settings.cache_clear()
+    reset_settings_cache()
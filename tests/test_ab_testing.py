@@ -0,0 +1,471 @@
+"""Tests for the A/B testing framework."""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from mcp_search_hub.experimentation.ab_testing import (
+    ABTestingManager,
+    Assignment,
+    ExperimentResult,
+    _open_managers,
+)
+from mcp_search_hub.models.query import SearchQuery
+from mcp_search_hub.models.results import SearchResponse
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a manager that stores experiments in a temporary directory."""
+    return ABTestingManager(storage_dir=str(tmp_path))
+
+
+def _create_ab_experiment(manager, **kwargs):
+    return manager.create_experiment(
+        name="ranking",
+        variants=[
+            {"id": "control", "config": {}},
+            {"id": "treatment", "config": {"boost": True}},
+        ],
+        **kwargs,
+    )
+
+
+class TestVariantAssignment:
+    """Test variant assignment strategies."""
+
+    def test_deterministic_assignment_is_stable(self, manager):
+        """Test that the same query always lands in the same variant."""
+        experiment = _create_ab_experiment(manager)
+        query = SearchQuery(query="python asyncio tutorial")
+
+        first = manager.assign_variant(experiment, query)
+        for _ in range(10):
+            assert manager.assign_variant(experiment, query).id == first.id
+
+    def test_deterministic_assignment_splits_traffic(self, manager):
+        """Test that equal weights split queries roughly evenly."""
+        experiment = _create_ab_experiment(manager)
+
+        counts = {"control": 0, "treatment": 0}
+        for i in range(2000):
+            variant = manager.assign_variant(
+                experiment, SearchQuery(query=f"query {i}")
+            )
+            counts[variant.id] += 1
+
+        assert 800 < counts["control"] < 1200
+        assert 800 < counts["treatment"] < 1200
+
+    def test_random_assignment_respects_weights(self, tmp_path):
+        """Test that random assignment follows the relative variant weights."""
+        manager = ABTestingManager(
+            storage_dir=str(tmp_path), assignment_strategy=Assignment.RANDOM
+        )
+        experiment = manager.create_experiment(
+            name="weighted",
+            variants=[
+                {"id": "heavy", "weight": 3.0, "config": {}},
+                {"id": "light", "weight": 1.0, "config": {}},
+            ],
+        )
+        query = SearchQuery(query="weighted query")
+
+        heavy = sum(
+            manager.assign_variant(experiment, query).id == "heavy" for _ in range(4000)
+        )
+        assert 2700 < heavy < 3300
+
+    def test_user_id_assignment_is_stable(self, tmp_path):
+        """Test that user-based assignment ignores the query text."""
+        manager = ABTestingManager(
+            storage_dir=str(tmp_path), assignment_strategy=Assignment.USER_ID
+        )
+        experiment = _create_ab_experiment(manager)
+
+        variants = {
+            manager.assign_variant(
+                experiment, SearchQuery(query=f"query {i}"), user_id="user-42"
+            ).id
+            for i in range(20)
+        }
+        assert len(variants) == 1
+
+    def test_weight_edits_take_effect(self, manager):
+        """Test that changing variant weights is picked up by assignment."""
+        experiment = _create_ab_experiment(manager)
+        query = SearchQuery(query="edited weights")
+        manager.assign_variant(experiment, query)
+
+        experiment.variants[0].weight = 0.0
+        for i in range(20):
+            variant = manager.assign_variant(
+                experiment, SearchQuery(query=f"query {i}")
+            )
+            assert variant.id == "treatment"
+
+    def test_zero_total_weight_is_rejected(self, manager):
+        """Test that experiments without a positive weight fail clearly."""
+        with pytest.raises(ValueError, match="positive weight"):
+            manager.create_experiment(
+                name="empty",
+                variants=[{"id": "a", "weight": 0.0, "config": {}}],
+            )
+        assert manager.list_experiments() == []
+
+
+class TestTrafficInclusion:
+    """Test traffic-percentage inclusion."""
+
+    def test_full_traffic_includes_everything(self, manager):
+        """Test that 100% traffic includes every query."""
+        experiment = _create_ab_experiment(manager)
+
+        assert all(
+            manager.should_include_in_experiment(
+                experiment, SearchQuery(query=f"query {i}")
+            )
+            for i in range(100)
+        )
+
+    def test_partial_traffic_matches_percentage(self, manager):
+        """Test that the included share of queries tracks traffic_percentage."""
+        experiment = _create_ab_experiment(manager, traffic_percentage=25.0)
+
+        included = sum(
+            manager.should_include_in_experiment(
+                experiment, SearchQuery(query=f"query {i}")
+            )
+            for i in range(4000)
+        )
+        assert 850 < included < 1150
+
+
+class TestResultStorage:
+    """Test experiment result persistence."""
+
+    @pytest.mark.asyncio
+    async def test_results_are_batched_into_jsonl(self, tmp_path):
+        """Test that results are buffered and appended as JSON lines."""
+        manager = ABTestingManager(storage_dir=str(tmp_path), result_batch_size=10)
+        experiment = _create_ab_experiment(manager)
+
+        async def execute(query, config):
+            return SearchResponse(
+                results=[],
+                query=query.query,
+                total_results=0,
+                provider="test",
+            )
+
+        for i in range(3):
+            await manager.process_query(
+                SearchQuery(query=f"query {i}"), experiment.id, execute
+            )
+
+        results_dir = tmp_path / "results" / experiment.id
+        assert not results_dir.exists()
+        assert len(manager.get_results(experiment.id)) == 3
+
+        manager.flush_results()
+
+        (results_file,) = results_dir.glob("*.jsonl")
+        records = [json.loads(line) for line in results_file.read_text().splitlines()]
+        assert [r["query"] for r in records] == ["query 0", "query 1", "query 2"]
+        assert all("response" not in r for r in records)
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_writes_partial_batch(self, tmp_path):
+        """Test that a partial batch is handed off once the interval passes."""
+        manager = ABTestingManager(
+            storage_dir=str(tmp_path), result_flush_interval=0.01
+        )
+        experiment = _create_ab_experiment(manager)
+
+        manager._save_result(
+            experiment.id,
+            ExperimentResult(variant_id="control", query="quiet", latency_ms=1.0),
+        )
+        assert len(manager._pending_results) == 1
+
+        await asyncio.sleep(0.05)
+        assert manager._pending_results == []
+
+    def test_flush_timer_is_rearmed_on_a_new_loop(self, tmp_path):
+        """Test that a timer left on a closed loop does not block the interval."""
+        manager = ABTestingManager(
+            storage_dir=str(tmp_path), result_flush_interval=0.05
+        )
+        experiment = _create_ab_experiment(manager)
+
+        async def record(query, wait):
+            manager._save_result(
+                experiment.id,
+                ExperimentResult(variant_id="control", query=query, latency_ms=1.0),
+            )
+            await asyncio.sleep(wait)
+
+        # The first loop closes before its timer fires
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(record("first", 0))
+        finally:
+            loop.close()
+        assert len(manager._pending_results) == 1
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(record("second", 0.2))
+        finally:
+            loop.close()
+        assert manager._pending_results == []
+        assert manager._flush_timer is None
+
+    @pytest.mark.asyncio
+    async def test_load_waits_for_background_writes(self, tmp_path):
+        """Test that reading results joins writes still on the writer thread."""
+        manager = ABTestingManager(storage_dir=str(tmp_path), result_batch_size=1)
+        experiment = _create_ab_experiment(manager)
+
+        for i in range(5):
+            manager._save_result(
+                experiment.id,
+                ExperimentResult(variant_id="control", query=f"q{i}", latency_ms=1.0),
+            )
+
+        loaded = manager.load_results_from_disk(experiment.id)
+        assert [r.query for r in loaded] == [f"q{i}" for i in range(5)]
+        assert not manager._pending_writes
+
+    @pytest.mark.asyncio
+    async def test_flush_keeps_order_behind_slow_writes(self, tmp_path):
+        """Test that a flush lands after background writes still in flight."""
+        manager = ABTestingManager(storage_dir=str(tmp_path), result_batch_size=2)
+        experiment = _create_ab_experiment(manager)
+        write_results = manager._write_results
+
+        def slow_write_results(batch):
+            # Only the background write of the first full batch is slow
+            if '"q0"' in batch[0][2]:
+                time.sleep(0.1)
+            write_results(batch)
+
+        manager._write_results = slow_write_results
+        for i in range(3):
+            manager._save_result(
+                experiment.id,
+                ExperimentResult(variant_id="control", query=f"q{i}", latency_ms=1.0),
+            )
+        assert manager._pending_writes
+
+        loaded = manager.load_results_from_disk(experiment.id)
+        assert [r.query for r in loaded] == ["q0", "q1", "q2"]
+
+    def test_results_are_sharded_by_timestamp(self, tmp_path):
+        """Test that each result lands in the shard for the hour it was recorded."""
+        manager = ABTestingManager(storage_dir=str(tmp_path))
+        experiment = _create_ab_experiment(manager)
+        recorded = datetime(2025, 5, 21, 14, 59)
+
+        manager._save_result(
+            experiment.id,
+            ExperimentResult(
+                variant_id="control", query="old", latency_ms=1.0, timestamp=recorded
+            ),
+        )
+        manager.flush_results()
+
+        (results_file,) = (tmp_path / "results" / experiment.id).glob("*.jsonl")
+        assert results_file.name == "2025052114.jsonl"
+
+    def test_close_writes_buffered_results(self, tmp_path):
+        """Test that close() drains results still waiting for a batch."""
+        manager = ABTestingManager(storage_dir=str(tmp_path))
+        experiment = _create_ab_experiment(manager)
+        manager._save_result(
+            experiment.id,
+            ExperimentResult(variant_id="control", query="last", latency_ms=1.0),
+        )
+
+        manager.close()
+
+        (results_file,) = (tmp_path / "results" / experiment.id).glob("*.jsonl")
+        assert json.loads(results_file.read_text())["query"] == "last"
+
+    @pytest.mark.asyncio
+    async def test_close_releases_writer_and_exit_hook(self, tmp_path):
+        """Test that close() stops the writer and forgets the manager at exit."""
+        manager = ABTestingManager(storage_dir=str(tmp_path), result_batch_size=1)
+        experiment = _create_ab_experiment(manager)
+        assert manager in _open_managers
+
+        manager.close()
+        manager.close()
+
+        assert manager not in _open_managers
+        with pytest.raises(RuntimeError):
+            manager._writer.submit(print)
+
+        # Later results bypass the stopped writer thread
+        manager._save_result(
+            experiment.id,
+            ExperimentResult(variant_id="control", query="late", latency_ms=1.0),
+        )
+        loaded = manager.load_results_from_disk(experiment.id)
+        assert [r.query for r in loaded] == ["late"]
+
+    @pytest.mark.asyncio
+    async def test_load_results_from_disk(self, manager):
+        """Test reading stored results back from the hourly shards."""
+        experiment = _create_ab_experiment(manager)
+
+        async def execute(query, config):
+            return SearchResponse(
+                results=[], query=query.query, total_results=0, provider="test"
+            )
+
+        for i in range(3):
+            await manager.process_query(
+                SearchQuery(query=f"query {i}"), experiment.id, execute
+            )
+
+        loaded = manager.load_results_from_disk(experiment.id)
+        assert [r.query for r in loaded] == ["query 0", "query 1", "query 2"]
+        assert all(r.response is None for r in loaded)
+
+        future = datetime.now() + timedelta(hours=2)
+        assert manager.load_results_from_disk(experiment.id, since=future) == []
+        assert manager.load_results_from_disk("missing") == []
+
+    def test_in_memory_results_are_bounded(self, tmp_path):
+        """Test that only the most recent results are kept in memory."""
+        manager = ABTestingManager(storage_dir=str(tmp_path), max_in_memory_results=5)
+        experiment = _create_ab_experiment(manager)
+
+        for i in range(8):
+            manager._save_result(
+                experiment.id,
+                ExperimentResult(variant_id="control", query=f"q{i}", latency_ms=1.0),
+            )
+
+        assert [r.query for r in manager.get_results(experiment.id)] == [
+            "q3",
+            "q4",
+            "q5",
+            "q6",
+            "q7",
+        ]
+        assert [r.query for r in manager.get_results(experiment.id, limit=2)] == [
+            "q6",
+            "q7",
+        ]
+        assert manager.get_results("missing") == []
+
+
+class TestExperimentStorage:
+    """Test experiment definition persistence."""
+
+    def test_experiments_reload_from_storage(self, tmp_path):
+        """Test that saved experiments are loaded by a new manager."""
+        manager = ABTestingManager(storage_dir=str(tmp_path))
+        experiment = _create_ab_experiment(manager, traffic_percentage=50.0)
+        (tmp_path / "experiments" / "notes.txt").write_text("not an experiment")
+        (tmp_path / "experiments" / "broken.json").write_text("{")
+
+        reloaded = ABTestingManager(storage_dir=str(tmp_path))
+
+        assert list(reloaded.experiments) == [experiment.id]
+        loaded = reloaded.get_experiment(experiment.id)
+        assert loaded.traffic_percentage == 50.0
+        assert [v.id for v in loaded.variants] == ["control", "treatment"]
+
+
+class TestExperimentAnalysis:
+    """Test experiment analysis."""
+
+    def test_analyze_experiment_metrics(self, manager):
+        """Test per-variant aggregate metrics."""
+        experiment = _create_ab_experiment(manager)
+        for i, latency in enumerate([10.0, 20.0, 30.0, 40.0]):
+            manager._save_result(
+                experiment.id,
+                ExperimentResult(
+                    variant_id="control",
+                    query=f"query {i}",
+                    latency_ms=latency,
+                    error="boom" if i == 0 else None,
+                ),
+            )
+
+        analysis = manager.analyze_experiment(experiment.id)
+
+        control = analysis["variants"]["control"]
+        assert analysis["total_queries"] == 4
+        assert control["count"] == 4
+        assert control["avg_latency_ms"] == 25.0
+        assert control["avg_result_count"] == 0.0
+        assert control["error_rate"] == 0.25
+        assert control["p50_latency_ms"] == pytest.approx(25.0)
+        assert control["p99_latency_ms"] == pytest.approx(39.7)
+        assert analysis["variants"]["treatment"] == {"error": "No results"}
+
+
+class TestShadowTesting:
+    """Test shadow testing."""
+
+    @pytest.mark.asyncio
+    async def test_shadow_variants_run_concurrently(self, manager):
+        """Test that all variants run at the same time and record results."""
+        experiment = _create_ab_experiment(manager)
+        running = 0
+        peak = 0
+
+        async def execute(query, config):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if config.get("boost"):
+                raise RuntimeError("variant failed")
+            return SearchResponse(
+                results=[], query=query.query, total_results=0, provider="test"
+            )
+
+        await manager.run_shadow_test(
+            SearchQuery(query="shadow"), experiment.id, execute
+        )
+
+        assert peak == 2
+        results = {r.variant_id: r for r in manager.get_results(experiment.id)}
+        assert results["control"].error is None
+        assert results["treatment"].error == "variant failed"
+        assert all(r.metrics["is_shadow"] for r in results.values())
+
+    def test_shadow_tests_run_on_successive_event_loops(self, tmp_path):
+        """Test that the concurrency bound is not tied to the first event loop."""
+        manager = ABTestingManager(storage_dir=str(tmp_path), max_shadow_concurrency=1)
+        experiment = _create_ab_experiment(manager)
+
+        async def execute(query, config):
+            await asyncio.sleep(0.001)
+            return SearchResponse(
+                results=[], query=query.query, total_results=0, provider="test"
+            )
+
+        # Fresh loops that are never installed as the thread's current loop
+        for i in range(2):
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(
+                    manager.run_shadow_test(
+                        SearchQuery(query=f"shadow {i}"), experiment.id, execute
+                    )
+                )
+            finally:
+                loop.close()
+
+        assert len(manager.get_results(experiment.id)) == 4
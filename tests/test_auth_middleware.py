@@ -97,6 +97,19 @@ class TestAuthMiddleware:
         response = client.get("/docs")
         assert response.status_code == 200
 
+    def test_skipped_path_prefixes(self):
+        """Test that skipping applies below a skipped path, on segment boundaries."""
+        app = create_test_app(api_keys=["test_key"], skip_auth_paths=["/docs"])
+        client = TestClient(app)
+
+        # Sub-paths of a skipped path bypass auth (and hit the router's 404)
+        response = client.get("/docs/oauth2-redirect")
+        assert response.status_code == 404
+
+        # A path merely sharing the prefix still requires auth
+        response = client.get("/docsearch")
+        assert response.status_code == 401
+
     def test_valid_api_key_header(self):
         """Test requests with valid API key in X-API-Key header."""
         app = create_test_app(api_keys=["test_key1", "test_key2"])
@@ -136,6 +149,8 @@ class TestAuthMiddleware:
         # Missing key should fail
         response = client.get("/test")
         assert response.status_code == 401
+        assert response.json()["error_type"] == "AuthenticationError"
+        assert response.headers["WWW-Authenticate"].startswith("Bearer")
 
     def test_case_insensitive_headers(self):
         """Test that headers are handled case-insensitively."""
@@ -0,0 +1,69 @@
+"""Tests for the combined authentication and error handling middleware."""
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from mcp_search_hub.middleware.combined import CombinedAuthErrorMiddleware
+from mcp_search_hub.utils.errors import SearchError
+
+
+def create_test_app(**middleware_options):
+    """Create a test Starlette app with CombinedAuthErrorMiddleware."""
+
+    async def success_endpoint(request):
+        return JSONResponse({"result": "success"})
+
+    async def error_endpoint(request):
+        raise SearchError(message="Search failed", status_code=400)
+
+    app = Starlette(
+        routes=[
+            Route("/test", success_endpoint),
+            Route("/error", error_endpoint),
+            Route("/health", success_endpoint),
+        ]
+    )
+    app.add_middleware(CombinedAuthErrorMiddleware, **middleware_options)
+    return app
+
+
+class TestCombinedAuthErrorMiddleware:
+    """Test cases for CombinedAuthErrorMiddleware."""
+
+    def test_valid_api_key(self):
+        """Test that a valid key reaches the endpoint."""
+        client = TestClient(create_test_app(api_keys=["test_key"]))
+
+        response = client.get("/test", headers={"Authorization": "Bearer test_key"})
+        assert response.status_code == 200
+        assert response.json() == {"result": "success"}
+
+    def test_missing_api_key(self):
+        """Test that a missing key is rejected before the endpoint runs."""
+        client = TestClient(create_test_app(api_keys=["test_key"]))
+
+        response = client.get("/error")
+        assert response.status_code == 401
+        assert response.json()["error_type"] == "AuthenticationError"
+
+    def test_skipped_path(self):
+        """Test that skipped paths bypass authentication."""
+        client = TestClient(create_test_app(api_keys=["test_key"]))
+
+        response = client.get("/health")
+        assert response.status_code == 200
+
+    def test_errors_are_handled(self):
+        """Test that downstream exceptions become JSON error responses."""
+        client = TestClient(
+            create_test_app(api_keys=["test_key"], include_traceback=True)
+        )
+
+        response = client.get("/error", headers={"X-API-Key": "test_key"})
+        assert response.status_code == 400
+        data = response.json()
+        assert data["error_type"] == "SearchError"
+        assert data["message"] == "Search failed"
+        assert "traceback" in data
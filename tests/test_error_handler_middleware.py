@@ -93,6 +93,7 @@ async def test_auth_error_handling():
     data = response.json()
     assert data["message"] == "Invalid API key"
     assert data["error_type"] == "AuthenticationError"
+    assert response.headers["WWW-Authenticate"].startswith("Bearer")
 
 
 @pytest.mark.asyncio
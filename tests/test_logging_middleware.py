@@ -1,15 +1,19 @@
 """Tests for logging middleware."""
 
 import json
+import logging
 import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 from fastmcp import Context
+from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import JSONResponse, Response
+from starlette.testclient import TestClient
 
-from mcp_search_hub.middleware.logging import LoggingMiddleware
+from mcp_search_hub.middleware.logging import TRACE_ID_VAR, LoggingMiddleware
+from mcp_search_hub.utils.logging import TraceIdFilter
 
 
 class TestLoggingMiddleware:
@@ -353,3 +357,102 @@ class TestLoggingMiddleware:
 
             # Should include type info instead of actual response
             assert "dict" in log_call
+
+
+def test_asgi_logging_redacts_sensitive_headers(caplog):
+    """Test that request logs redact sensitive headers straight from the scope."""
+    app = Starlette()
+
+    @app.route("/test")
+    async def test_route(request):
+        return JSONResponse({"trace_id": request.state.trace_id})
+
+    app.add_middleware(LoggingMiddleware, sensitive_headers=["X-API-Key"])
+
+    with caplog.at_level("INFO", logger="mcp_search_hub.middleware.logging"):
+        response = TestClient(app).get(
+            "/test?q=1", headers={"X-API-Key": "secret", "Accept": "text/plain"}
+        )
+
+    assert response.status_code == 200
+    request_log = next(
+        r.getMessage() for r in caplog.records if "HTTP Request" in r.getMessage()
+    )
+    log_data = json.loads(request_log.split(": ", 1)[1])
+    assert log_data["trace_id"] == response.json()["trace_id"]
+    assert log_data["query_string"] == "q=1"
+    assert log_data["headers"]["x-api-key"] == "REDACTED"
+    assert log_data["headers"]["accept"] == "text/plain"
+
+
+def test_debug_logging_adds_parsed_query(caplog):
+    """Test that debug logging keeps the raw query string and adds parsed params."""
+    app = Starlette()
+
+    @app.route("/test")
+    async def test_route(request):
+        return JSONResponse({})
+
+    app.add_middleware(LoggingMiddleware, log_level="DEBUG")
+
+    with caplog.at_level("INFO", logger="mcp_search_hub.middleware.logging"):
+        TestClient(app).get("/test?q=1&page=2")
+
+    request_log = next(
+        r.getMessage() for r in caplog.records if "HTTP Request" in r.getMessage()
+    )
+    log_data = json.loads(request_log.split(": ", 1)[1])
+    assert log_data["query_string"] == "q=1&page=2"
+    assert log_data["query"] == {"q": "1", "page": "2"}
+
+
+def test_trace_id_context_var_is_set_for_handlers():
+    """Test that handlers can read the trace ID from context during a request."""
+    app = Starlette()
+
+    @app.route("/test")
+    async def test_route(request):
+        return JSONResponse(
+            {"state": request.state.trace_id, "context": TRACE_ID_VAR.get()}
+        )
+
+    app.add_middleware(LoggingMiddleware)
+
+    body = TestClient(app).get("/test").json()
+
+    assert body["context"] is not None
+    assert body["context"] == body["state"]
+    assert TRACE_ID_VAR.get() is None
+
+
+def test_trace_id_filter_stamps_records():
+    """Test that log records carry the trace ID of the current request."""
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+    assert TraceIdFilter().filter(record)
+    assert record.trace_id == "-"
+
+    token = TRACE_ID_VAR.set("abc123")
+    try:
+        TraceIdFilter().filter(record)
+    finally:
+        TRACE_ID_VAR.reset(token)
+    assert record.trace_id == "abc123"
+
+
+def test_format_body_truncates_bytes_before_decoding():
+    """Test that captured body prefixes are decoded and marked as truncated."""
+    middleware = LoggingMiddleware(None, max_body_size=5)
+
+    # A multi-byte character cut by the limit is dropped, not treated as binary
+    assert (
+        middleware._format_body("héllo!".encode()[:5], 7)
+        == "héll... [truncated, 7 bytes total]"
+    )
+    assert middleware._format_body(b"short", 5) == "short"
+    # Malformed bytes are replaced rather than dropped, even at the end
+    assert middleware._format_body(b"\xff\xfeab", 4) == "\ufffd\ufffdab"
+    assert middleware._format_body(b"abc\xff", 4) == "abc\ufffd"
+    assert (
+        middleware._format_body(b"abcd\xff", 9)
+        == "abcd\ufffd... [truncated, 9 bytes total]"
+    )
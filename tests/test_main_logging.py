@@ -1,7 +1,9 @@
+import asyncio
 import logging
 from argparse import Namespace
 
 import mcp_search_hub.main as main_mod
+from mcp_search_hub.config import reset_settings_cache
 
 
 def test_main_configures_logging(monkeypatch, caplog):
@@ -36,10 +38,36 @@ def test_main_configures_logging(monkeypatch, caplog):
     monkeypatch.setattr(main_mod.SearchServer, "run", dummy_run)
 
     monkeypatch.delenv("LOG_LEVEL", raising=False)
-    main_mod.get_settings.cache_clear()
+    reset_settings_cache()
     main_mod.main()
 
     assert logged_levels == [logging.WARNING]
     messages = [rec.message for rec in caplog.records]
     assert "warning message" in messages
     assert "debug message" not in messages
+
+
+class _FakeUvloopPolicy(asyncio.DefaultEventLoopPolicy):
+    pass
+
+
+def test_install_uvloop_sets_policy_when_available(monkeypatch):
+    monkeypatch.setattr(main_mod, "UVLOOP_AVAILABLE", True)
+    monkeypatch.setattr(
+        main_mod, "uvloop", Namespace(EventLoopPolicy=_FakeUvloopPolicy)
+    )
+    original = asyncio.get_event_loop_policy()
+
+    try:
+        assert main_mod.install_uvloop() is True
+        assert isinstance(asyncio.get_event_loop_policy(), _FakeUvloopPolicy)
+    finally:
+        asyncio.set_event_loop_policy(original)
+
+
+def test_install_uvloop_is_noop_when_unavailable(monkeypatch):
+    monkeypatch.setattr(main_mod, "UVLOOP_AVAILABLE", False)
+    policy = asyncio.get_event_loop_policy()
+
+    assert main_mod.install_uvloop() is False
+    assert asyncio.get_event_loop_policy() is policy
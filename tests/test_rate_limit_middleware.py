@@ -1,6 +1,5 @@
 """Tests for rate limiting middleware."""
 
-import asyncio
 import time
 from collections import defaultdict
 from unittest.mock import AsyncMock, MagicMock
@@ -10,92 +9,87 @@ from starlette.requests import Request
 from starlette.responses import Response
 
 from mcp_search_hub.middleware.rate_limit import RateLimiter, RateLimitMiddleware
+from mcp_search_hub.utils.errors import ProviderRateLimitError
 
 
 class TestRateLimiter:
     """Test cases for the RateLimiter class."""
 
-    @pytest.mark.asyncio
-    async def test_initialization(self):
+    def test_initialization(self):
         """Test rate limiter initialization."""
         limiter = RateLimiter(limit=10, window=60)
 
         assert limiter.limit == 10
         assert limiter.window == 60
-        assert limiter.requests == []
-        assert limiter._lock is not None
+        assert limiter.tokens == 10
 
-    @pytest.mark.asyncio
-    async def test_check_rate_limit_allowed(self):
+    def test_check_rate_limit_allowed(self):
         """Test rate limiter allows requests under the limit."""
         limiter = RateLimiter(limit=3, window=60)
 
         # First request
-        allowed, remaining, reset = await limiter.check_rate_limit("test_client")
+        allowed, remaining, reset = limiter.check_rate_limit("test_client")
         assert allowed is True
         assert remaining == 2
         assert reset == 60
 
         # Second request
-        allowed, remaining, reset = await limiter.check_rate_limit("test_client")
+        allowed, remaining, reset = limiter.check_rate_limit("test_client")
         assert allowed is True
         assert remaining == 1
         assert reset == 60
 
         # Third request
-        allowed, remaining, reset = await limiter.check_rate_limit("test_client")
+        allowed, remaining, reset = limiter.check_rate_limit("test_client")
         assert allowed is True
         assert remaining == 0
         assert reset == 60
 
-    @pytest.mark.asyncio
-    async def test_check_rate_limit_exceeded(self):
+    def test_check_rate_limit_exceeded(self):
         """Test rate limiter blocks requests over the limit."""
         limiter = RateLimiter(limit=2, window=60)
 
         # First request
-        await limiter.check_rate_limit("test_client")
+        limiter.check_rate_limit("test_client")
 
         # Second request
-        await limiter.check_rate_limit("test_client")
+        limiter.check_rate_limit("test_client")
 
         # Third request (should be blocked)
-        allowed, remaining, reset = await limiter.check_rate_limit("test_client")
+        allowed, remaining, reset = limiter.check_rate_limit("test_client")
         assert allowed is False
         assert remaining == 0
         assert reset > 0  # Should have some time until reset
 
-    @pytest.mark.asyncio
-    async def test_cleanup_expired_requests(self):
-        """Test rate limiter cleans up expired requests."""
-        limiter = RateLimiter(limit=2, window=1)  # 1 second window
+    def test_tokens_refill_over_time(self):
+        """Test rate limiter refills tokens as time passes."""
+        limiter = RateLimiter(limit=2, window=1)  # 2 requests per second
 
-        # Add a request with an old timestamp
-        limiter.requests = [time.time() - 2]  # 2 seconds ago
+        # Drain the bucket
+        limiter.check_rate_limit("test_client")
+        limiter.check_rate_limit("test_client")
+        allowed, _, _ = limiter.check_rate_limit("test_client")
+        assert allowed is False
 
-        # Make a new request
-        allowed, remaining, reset = await limiter.check_rate_limit("test_client")
+        # Pretend 2 seconds have passed; the bucket refills to capacity only
+        limiter.last -= 2
 
-        # The old request should be cleaned up
+        allowed, remaining, reset = limiter.check_rate_limit("test_client")
         assert allowed is True
         assert remaining == 1
-        assert len(limiter.requests) == 1  # Only the new request remains
 
-    @pytest.mark.asyncio
-    async def test_concurrent_requests(self):
-        """Test rate limiter handles concurrent requests correctly."""
+    def test_requests_up_to_limit(self):
+        """Test rate limiter allows exactly ``limit`` back-to-back requests."""
         limiter = RateLimiter(limit=10, window=60)
 
-        # Run 10 concurrent requests
-        results = await asyncio.gather(
-            *[limiter.check_rate_limit(f"client_{i}") for i in range(10)]
-        )
+        # Run 10 requests
+        results = [limiter.check_rate_limit(f"client_{i}") for i in range(10)]
 
         # All should be allowed
         assert all(allowed for allowed, _, _ in results)
 
         # The 11th request should be blocked
-        allowed, remaining, reset = await limiter.check_rate_limit("extra")
+        allowed, remaining, reset = limiter.check_rate_limit("extra")
         assert allowed is False
         assert remaining == 0
 
@@ -366,3 +360,47 @@ async def test_integration_with_multiple_clients():
     # But client2 should still be allowed
     result4 = await middleware.process_request(client2_req)
     assert result4 == client2_req
+
+
+def test_client_limiters_are_bounded():
+    """Test that idle and excess per-client limiters are evicted."""
+    middleware = RateLimitMiddleware(None, limit=5, window=60, max_clients=2)
+
+    first = middleware._get_limiter("client1")
+    middleware._get_limiter("client2")
+    assert middleware._get_limiter("client1") is first
+
+    # Over capacity: the least recently used client is dropped
+    middleware._get_limiter("client3")
+    assert list(middleware.limiters) == ["client1", "client3"]
+
+    # Idle for a full window: evicted even under capacity
+    middleware.max_clients = 10
+    middleware.limiters["client1"].last -= 120
+    middleware.limiters.move_to_end("client1", last=False)
+    middleware._get_limiter("client4")
+    assert list(middleware.limiters) == ["client3", "client4"]
+
+
+@pytest.mark.asyncio
+async def test_skip_paths_match_on_segment_boundaries():
+    """Test that skipping covers sub-paths but not paths sharing a prefix."""
+    middleware = RateLimitMiddleware(None, limit=1, window=60, skip_paths=["/health"])
+    call_next = AsyncMock(return_value=Response())
+
+    def make_request(path):
+        request = MagicMock(spec=Request)
+        request.url.path = path
+        request.headers = {}
+        request.client = None
+        return request
+
+    # Skipped paths never consume tokens
+    for _ in range(3):
+        await middleware.dispatch(make_request("/health"), call_next)
+        await middleware.dispatch(make_request("/health/live"), call_next)
+
+    # /healthz only shares a prefix, so it is rate limited
+    await middleware.dispatch(make_request("/healthz"), call_next)
+    with pytest.raises(ProviderRateLimitError):
+        await middleware.dispatch(make_request("/healthz"), call_next)
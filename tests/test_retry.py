@@ -5,7 +5,13 @@ from unittest.mock import MagicMock
 import httpx
 import pytest
 
-from mcp_search_hub.utils.errors import ProviderTimeoutError
+from mcp_search_hub.utils.errors import (
+    NetworkConnectionError,
+    NetworkTimeoutError,
+    ProviderRateLimitError,
+    ProviderTimeoutError,
+    SearchError,
+)
 from mcp_search_hub.utils.retry import (
     RetryConfig,
     is_retryable_exception,
@@ -131,6 +137,30 @@ class TestRetryableExceptions:
         assert not is_retryable_exception(TypeError("type error"))
         assert not is_retryable_exception(KeyError("key error"))
 
+    def test_transient_flag_overrides_message(self):
+        """Test that an explicit transient flag decides without a message check."""
+        assert is_retryable_exception(SearchError("Upstream hiccup", transient=True))
+        assert not is_retryable_exception(
+            SearchError("Temporary failure", transient=False)
+        )
+        assert is_retryable_exception(SearchError("Temporary failure"))
+
+        # Flags beat the always-retryable types too
+        assert not is_retryable_exception(
+            ProviderTimeoutError("provider timeout", "test", transient=False)
+        )
+        assert not is_retryable_exception(
+            ProviderRateLimitError("test", transient=False)
+        )
+
+    def test_transient_error_classes(self):
+        """Test that temporary error classes carry the flag by default."""
+        assert ProviderTimeoutError("test").transient is True
+        assert ProviderRateLimitError("test").transient is True
+        assert NetworkConnectionError().transient is True
+        assert NetworkTimeoutError().transient is True
+        assert SearchError("plain").transient is None
+
 
 class TestRetryDecorator:
     """Test the retry decorator functionality."""
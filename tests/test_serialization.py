@@ -0,0 +1,34 @@
+"""Tests for the JSON serialization helpers."""
+
+import json
+
+import pytest
+
+from mcp_search_hub.utils import serialization
+from mcp_search_hub.utils.serialization import dumps_json, render_json
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_encoders_agree(monkeypatch, use_orjson):
+    """Test that the orjson and stdlib paths produce the same compact JSON."""
+    if use_orjson and not serialization.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", use_orjson)
+
+    data = {"message": "héllo", "count": 2, 3: "int key"}
+    body = render_json(data)
+
+    assert isinstance(body, bytes)
+    assert body == '{"message":"héllo","count":2,"3":"int key"}'.encode()
+    assert dumps_json(data) == body.decode()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_unsupported_values_fall_back_to_str(monkeypatch, use_orjson):
+    """Test that values JSON cannot represent are stringified."""
+    if use_orjson and not serialization.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", use_orjson)
+
+    value = {1, 2}
+    assert json.loads(render_json({"value": value})) == {"value": str(value)}
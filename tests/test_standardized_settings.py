@@ -4,9 +4,16 @@ import os
 import tempfile
 from unittest.mock import patch
 
-from pydantic import SecretStr
+import pytest
+from pydantic import SecretStr, ValidationError
 
-from mcp_search_hub.config.settings import AppSettings, get_settings
+from mcp_search_hub.config.settings import (
+    AppSettings,
+    MiddlewareConfig,
+    ProviderSettings,
+    get_settings,
+    reset_settings_cache,
+)
 
 
 class TestAppSettings:
@@ -114,10 +121,10 @@ CACHE__REDIS_ENABLED=true
 
     def test_secret_str_handling(self):
         """Test that API keys are handled as SecretStr properly."""
-        settings = AppSettings()
-
         # Set a secret value as SecretStr
-        settings.linkup.api_key = SecretStr("secret_key_123")
+        settings = AppSettings(
+            linkup=ProviderSettings(api_key=SecretStr("secret_key_123"))
+        )
 
         # Should be SecretStr type
         assert hasattr(settings.linkup.api_key, "get_secret_value")
@@ -136,22 +143,41 @@ CACHE__REDIS_ENABLED=true
         assert settings.environment == "production"
 
         # Test invalid environment
-        try:
+        with pytest.raises(ValidationError):
             AppSettings(environment="invalid")
-            raise AssertionError("Should have raised ValidationError")
-        except Exception:
-            pass  # Expected
 
         # Test valid log level
         settings = AppSettings(log_level="DEBUG")
         assert settings.log_level == "DEBUG"
 
         # Test invalid log level
-        try:
+        with pytest.raises(ValidationError):
             AppSettings(log_level="INVALID")
-            raise AssertionError("Should have raised ValidationError")
-        except Exception:
-            pass  # Expected
+
+    def test_settings_are_frozen(self):
+        """Test that top-level settings cannot be reassigned after load."""
+        settings = AppSettings()
+
+        with pytest.raises(ValidationError):
+            settings.port = 9000
+
+        assert settings.port == 8000
+
+    def test_nested_defaults_shared_and_frozen(self):
+        """Test that default nested configs are shared, immutable instances."""
+        settings = AppSettings()
+        assert settings.linkup is settings.exa
+        assert settings.cache is AppSettings().cache
+
+        with pytest.raises(ValidationError):
+            settings.exa.enabled = False
+
+        assert settings.linkup.enabled is True
+
+    def test_sensitive_headers_normalized(self):
+        """Test that sensitive header names are lowercased at load time."""
+        config = MiddlewareConfig(logging_sensitive_headers=["X-Secret", "Cookie"])
+        assert config.logging_sensitive_headers == frozenset({"x-secret", "cookie"})
 
     def test_provider_helper_methods(self):
         """Test helper methods for provider configuration."""
@@ -173,11 +199,19 @@ CACHE__REDIS_ENABLED=true
         assert len(enabled) == 5  # All providers enabled by default
 
         # Test with disabled provider
-        settings.exa.enabled = False
+        settings = AppSettings(exa=ProviderSettings(enabled=False))
         enabled = settings.get_enabled_providers()
         assert "exa" not in enabled
         assert len(enabled) == 4
 
+        # Copies made with model_copy see their own provider settings
+        settings = AppSettings()
+        settings.get_enabled_providers()
+        copy = settings.model_copy(update={"exa": ProviderSettings(enabled=False)})
+        assert "exa" not in copy.get_enabled_providers()
+        assert copy.get_provider_config("EXA").enabled is False
+        assert settings.get_provider_config("unknown") is None
+
 
 class TestGetSettings:
     """Test get_settings function."""
@@ -185,7 +219,7 @@ class TestGetSettings:
     def test_cached_settings(self):
         """Test that settings are cached properly."""
         # Clear cache first
-        get_settings.cache_clear()
+        reset_settings_cache()
 
         # First call
         settings1 = get_settings()
@@ -199,7 +233,7 @@ class TestGetSettings:
     def test_environment_changes_after_cache(self):
         """Test that environment changes don't affect cached settings."""
         # Clear cache first
-        get_settings.cache_clear()
+        reset_settings_cache()
 
         # Get settings with current environment
         settings1 = get_settings()